@@ -10,10 +10,21 @@
 import streamlit as st
 st.set_page_config(page_title="MEC Generator", page_icon="🎬", layout="wide")
 
+import os
+import uuid
 import pandas as pd
-import requests
-import xml.etree.ElementTree as ET
-from generate_mec import generate_mec_xml_from_dataframe, is_valid_xml_structure
+from generate_mec import GENERATOR_VERSION, Title, build_title, generate_mec_xml, highlight_invalid_xml
+from mec_structure import best_match, diff_all, load_sample_indexes
+from mec_ingest import catalog_format, read_catalog
+from mec_validation import split_levels, validate_dataframe
+from batch_mec import ZipSink, generate_stream, normalize_titles, split_titles
+from mec_assets import check_assets
+from mec_hierarchy import build_hierarchy, check_hierarchy
+from mec_schema import schema_available, schema_error, validate_xml
+from mec_session import SessionStore
+from slack_notifier import SlackNotifier
+import mec_metrics
+from mec_metrics import stage
 
 # ---------- 사용자 정보 ----------
 USERS = {
@@ -108,82 +119,137 @@ def logout():
     st.session_state.username = ""
     st.rerun()
 
-def validate_summary_length(df):
-    errors = []
-    for i, row in df.iterrows():
-        s190 = str(row.get("summary190", ""))
-        s400 = str(row.get("summary400", ""))
-        if len(s190) > 190:
-            errors.append((i + 2, "summary190", len(s190)))
-        if len(s400) > 400:
-            errors.append((i + 2, "summary400", len(s400)))
-    return errors
-
-def validate_art_references(df):
-    errors = []
-    for idx, row in df.iterrows():
-        language = str(row.get("Language", f"행 {idx+2}")).strip()  # Language 컬럼 사용, 없으면 행 번호
-
-        boxart = row.get("boxart")
-        cover = row.get("cover")
-        poster = row.get("poster")
-
-        missing = []
-        if pd.isna(boxart) or str(boxart).strip() == "":
-            missing.append("boxart")
-        if pd.isna(cover) or str(cover).strip() == "":
-            missing.append("cover")
-        if pd.isna(poster) or str(poster).strip() == "":
-            missing.append("poster")
-
-        if missing:
-            errors.append((language, ", ".join(missing)))
-    return errors
-
-
-
-    
-def notify_slack_of_xml_error(error_message, filename="(알 수 없음)"):
+# 알림은 백그라운드 스레드가 모아서 보내므로 Slack 응답을 기다리지 않습니다. (모든 세션 공유)
+@st.cache_resource
+def get_slack_notifier():
     webhook_url = st.secrets.get("slack", {}).get("webhook")
-    payload = {
-        "text": f"*MEC XML 유효성 검사 실패!*\n📄 파일명: `{filename}`\n```{error_message}```"
-    }
-    try:
-        response = requests.post(webhook_url, json=payload)
-        if response.status_code != 200:
-            st.warning(f"Slack 전송 실패: {response.status_code} / {response.reason}")
-        else:
-            st.info("✅ Slack 전송 성공")
-    except Exception as e:
-        st.error(f"Slack 전송 중 예외 발생: {e}")
+    return SlackNotifier(webhook_url) if webhook_url else None
 
+def notify_slack_of_xml_error(error_message, filename="(알 수 없음)"):
+    notifier = get_slack_notifier()
+    if notifier is None:
+        st.warning("Slack webhook이 설정되지 않아 알림을 보내지 않습니다.")
+    elif notifier.notify(error_message, filename):
+        st.info("📨 Slack 알림 전송 대기열에 추가됨")
+    else:
+        st.warning("Slack 알림 대기열이 가득 차 알림을 보내지 못했습니다.")
+
+
+# ArtReference 파일이 있는 로컬 폴더. 설정하면 생성 후 파일 존재 여부와 이미지 크기를 확인합니다.
+ASSET_ROOT = os.environ.get("MEC_ASSET_ROOT", "")
+
+# ---------- 세션 자원 (업로드는 디스크에 스풀, 메모리에는 결과만) ----------
+# 모든 세션의 결과 메모리 합계 예산(MB)과 유휴 세션 정리 시간(분). 스풀 폴더 기본값은 시스템 임시 폴더입니다.
+SESSION_MEMORY_MB = int(os.environ.get("MEC_SESSION_MEMORY_MB", "512"))
+SESSION_IDLE_MINUTES = int(os.environ.get("MEC_SESSION_IDLE_MINUTES", "30"))
+PREVIEW_LINES = 200
+
+UPLOAD_TYPES = ["csv", "parquet", "feather", "xlsx"]
+
+@st.cache_resource
+def get_session_store():
+    return SessionStore(os.environ.get("MEC_SPOOL_DIR") or None, SESSION_MEMORY_MB * 1024 ** 2, SESSION_IDLE_MINUTES * 60)
+
+session_store = get_session_store()
+
+# 모든 탭이 같은 레코드 코어(read_catalog)로 읽습니다. 값은 CSV 문자열 그대로이므로 "000123" 같은 앞자리 0이 유지됩니다.
+# DataFrame은 검증/표시용 보기로만 만듭니다.
+def read_upload(upload):
+    fmt = catalog_format(upload.filename)
+    with stage(f"read_{fmt}"):
+        records = read_catalog(upload.path, fmt)
+    if not records:
+        raise ValueError("데이터 행이 없습니다.")
+    return records, pd.DataFrame(records)
+
+# 업로드 파일은 세션 임시 폴더에 스풀한 뒤 업로더 key를 바꿔 위젯이 업로드 바이트를 들고 있지 않게 합니다.
+def spooled_upload(slot, label):
+    counter = f"{slot}_uploader"
+    uploaded = st.file_uploader(label, type=UPLOAD_TYPES, key=f"{counter}_{st.session_state.get(counter, 0)}")
+    if uploaded is not None:
+        session_store.spool(session_id, slot, uploaded)
+        st.session_state[counter] = st.session_state.get(counter, 0) + 1
+        st.rerun()
+    upload = session_store.upload(session_id, slot)
+    if upload:
+        name_col, clear_col = st.columns([5, 1])
+        name_col.caption(f"📄 {upload.filename} ({upload.size / 1024 ** 2:.1f} MB)")
+        if clear_col.button("✖", key=f"{slot}_clear"):
+            session_store.clear(session_id, slot)
+            st.rerun()
+    return upload
+
+# MEC XSD(MEC_SCHEMA_DIR 또는 schemas/)와 lxml이 있으면 생성된 XML을 스키마로도 검증합니다.
+# 컴파일된 스키마는 프로세스당 한 번만 만들고, 없으면 매 실행 다시 확인합니다. (나중에 XSD를 넣어도 반영)
+def schema_check(df, title, xml):
+    errors = validate_xml(xml, title)
+    # 언어 → CSV 행 번호 (헤더가 1행). 타이틀 공통 값은 첫 행에서 읽으므로 2행으로 표시합니다.
+    rows = {"": 2}
+    if "language" in df.columns:
+        for i, language in enumerate(df["language"].astype(str)):
+            rows.setdefault(language, i + 2)
+    return pd.DataFrame(
+        [{"row": rows.get(e["language"], 2), **e} for e in errors],
+        columns=["row", "language", "column", "line", "message"],
+    )
 
-def extract_paths(xml_string):
-    try:
-        root = ET.fromstring(xml_string)
-        paths = set()
-        def recurse(node, path=""):
-            current = f"{path}/{node.tag}"
-            paths.add(current)
-            for child in node:
-                recurse(child, current)
-        recurse(root)
-        return paths, ""
-    except ET.ParseError as e:
-        return set(), f"Parse Error: {e}"
-
-def load_sample_xml(name):
-    try:
-        with open(name, "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
-        return None
-
-sample_library = {
-    "Movie": load_sample_xml("Movie.xml"),
-    "Series": load_sample_xml("Series.xml"),
-    "Episode": load_sample_xml("Episode.xml")
-}
+# 단일 파일: DataFrame은 계산하는 동안만 쓰고 검증 결과/생성 XML/확인 결과만 세션에 남깁니다.
+def process_single(upload):
+    records, df = read_upload(upload)
+    result = {"rows": len(df), "has_worktype": "worktype" in df.columns}
+    result["validation_errors"], result["validation_warnings"] = split_levels(validate_dataframe(df.copy()))
+    if not result["validation_errors"].empty:
+        return result
+
+    # Title은 한 번만 만들어 생성/아트 확인/XSD 검증이 함께 씁니다. (contentid 컬럼이 없어도 됩니다)
+    with stage("normalize"):
+        title = build_title(records)
+    generated = generate_mec_xml(title)
+    result["generated"] = generated
+    if ASSET_ROOT:
+        with stage("asset_check"):
+            result["asset_issues"] = check_assets([title], ASSET_ROOT)
+    if generated.valid and schema_available():
+        with stage("schema_check"):
+            result["schema_errors"] = schema_check(df, title, generated.xml)
+    return result
+
+# 일괄 생성: 타이틀별 XML은 결과 키별 공유 폴더의 ZIP으로 바로 쓰고 리포트 행과 확인 결과만 세션에 남깁니다.
+# 타이틀은 한 번만 정규화해 생성/아트 확인/계층 검사가 같은 Title을 씁니다.
+def process_batch(upload, key):
+    titles = list(normalize_titles(split_titles(read_catalog(upload.path, catalog_format(upload.filename)))))
+    result = {"zip_path": session_store.result_path(key, "MEC_Metadata_batch.zip")}
+    result["report"] = generate_stream(titles, ZipSink(result["zip_path"]), schema=schema_available())
+    result["asset_issues"] = []
+    if ASSET_ROOT:
+        with stage("asset_check"):
+            result["asset_issues"] = check_assets(titles, ASSET_ROOT)
+    # 시즌/에피소드가 있으면 부모 참조와 번호 연속성도 확인
+    result["hierarchy_issues"] = check_hierarchy(build_hierarchy((cid, t) for cid, t in titles if isinstance(t, Title)))
+    return result
+
+# 미리보기는 PREVIEW_LINES줄씩 나눠 현재 페이지만 브라우저로 보냅니다. 오류가 있으면 오류 줄이 있는 페이지부터 보여줍니다.
+def xml_preview(generated, key):
+    lines = generated.text.splitlines()
+    pages = max(1, -(-len(lines) // PREVIEW_LINES))
+    page = 1
+    if pages > 1:
+        first = (generated.line - 1) // PREVIEW_LINES + 1 if generated.line else 1
+        page = st.number_input(f"페이지 (총 {pages}쪽, {PREVIEW_LINES}줄씩)", 1, pages, min(first, pages), key=key)
+    start = (page - 1) * PREVIEW_LINES + 1
+    end = min(start + PREVIEW_LINES - 1, len(lines))
+    st.caption(f"{start}-{end}줄 / 전체 {len(lines)}줄")
+    if generated.valid:
+        st.code("\n".join(lines[start - 1:end]), language="xml")
+    else:
+        st.markdown(highlight_invalid_xml(generated, start, end), unsafe_allow_html=True)
+
+# 샘플 XML 구조는 프로세스 시작 시 한 번만 파싱합니다.
+@st.cache_resource
+def get_sample_indexes():
+    return load_sample_indexes()
+
+sample_indexes = get_sample_indexes()
 
 # ---------- 상단 인터페이스 ----------
 col1, col2 = st.columns([6, 1])
@@ -226,9 +292,89 @@ if st.session_state.show_login:
 if not st.session_state.logged_in:
     st.stop()
 
+# 로그인한 세션만 스풀 폴더/결과 메모리를 사용합니다. 매 실행마다 유휴 세션과 메모리 예산을 정리합니다.
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
+session_id = st.session_state.session_id
+session_store.touch(session_id)
+
+# ---------- 관리자: 단계별 성능 지표 ----------
+if st.session_state.username == "admin":
+    with st.expander("📊 성능 지표 (관리자)"):
+        metrics_on = st.toggle("단계별 계측 켜기", value=mec_metrics.ENABLED)
+        memory_on = st.toggle("메모리 계측 (tracemalloc, 느려짐)", value=False, disabled=not metrics_on)
+        if metrics_on:
+            mec_metrics.enable(memory=memory_on)
+        else:
+            mec_metrics.disable()
+
+        metrics_rows = mec_metrics.snapshot()
+        if metrics_rows:
+            st.dataframe(pd.DataFrame(metrics_rows), hide_index=True)
+        else:
+            st.caption("아직 수집된 지표가 없습니다.")
+        st.download_button(
+            label="📥 Prometheus 형식으로 내보내기",
+            data=mec_metrics.prometheus_text(),
+            file_name="mec_metrics.prom",
+            mime="text/plain"
+        )
+        store_stats = session_store.stats()
+        st.caption(
+            f"세션 {store_stats['sessions']}개 · 결과 {store_stats['results']}개 · 결과 메모리 {store_stats['memory_bytes'] / 1024 ** 2:.1f}"
+            f"/{SESSION_MEMORY_MB} MB · 스풀 {store_stats['spool_bytes'] / 1024 ** 2:.1f} MB · "
+            f"비운 결과 {store_stats['evictions']}회"
+        )
+
 # ---------- 탭 구성 ----------
-tab1, tab2 = st.tabs(["📄 MEC XML 생성", "🧩 2nd. Checkpoint"])
-generated_xml = None
+tab1, tab2, tab3 = st.tabs(["📄 MEC XML 생성", "🧩 2nd. Checkpoint", "📦 일괄 생성"])
+generated = None
+
+# ---------- 탭 3: 일괄 생성 ----------
+# 탭 1이 업로드 전 st.stop()으로 스크립트를 멈추므로 먼저 렌더링합니다.
+with tab3:
+    st.markdown('<div style="text-align:center;"><h4>카탈로그 CSV 업로드 후 contentid별 MEC 일괄 생성</h4></div>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([3, 5, 3])
+    with col2:
+        batch_upload = spooled_upload("batch", "📁 여러 타이틀이 담긴 카탈로그 파일을 업로드하세요 (CSV/Parquet/Feather/Excel)")
+
+    if batch_upload:
+        batch_key = (batch_upload.digest, GENERATOR_VERSION, schema_available())
+        # 결과는 세션끼리 공유하므로 다른 세션의 예산 정리가 렌더링 중에 ZIP을 지우지 않도록 끝날 때까지 고정합니다.
+        with session_store.pinned(batch_key):
+            try:
+                with st.spinner("MEC XML 일괄 생성 중..."):
+                    batch = session_store.cached(session_id, "batch", batch_key, lambda: process_batch(batch_upload, batch_key))
+            except (ValueError, ImportError) as e:
+                st.error(f"❌ {e}")
+            else:
+                batch_report = batch["report"]
+                failed_count = sum(r["status"] == "error" for r in batch_report)
+                if failed_count:
+                    st.error(f"❌ {len(batch_report)}개 중 {failed_count}개 타이틀 생성 실패")
+                    notify_slack_of_xml_error(f"일괄 생성 실패 {failed_count}건", batch_upload.filename)
+                else:
+                    st.success(f"✅ {len(batch_report)}개 타이틀 생성 완료!")
+                st.dataframe(pd.DataFrame(batch_report))
+                if not schema_available():
+                    st.caption(f"ℹ️ XSD 검증 비활성 — {schema_error()}")
+
+                if batch["asset_issues"]:
+                    st.warning(f"⚠️ 아트 파일 문제 {len(batch['asset_issues'])}건")
+                    st.dataframe(pd.DataFrame(batch["asset_issues"]))
+
+                if batch["hierarchy_issues"]:
+                    st.warning(f"⚠️ 시리즈/시즌/에피소드 계층 문제 {len(batch['hierarchy_issues'])}건")
+                    st.dataframe(pd.DataFrame(batch["hierarchy_issues"]))
+
+                with open(batch["zip_path"], "rb") as batch_zip:
+                    st.download_button(
+                        label="📥 MEC XML 일괄 다운로드 (ZIP)",
+                        data=batch_zip,
+                        file_name="MEC_Metadata_batch.zip",
+                        mime="application/zip"
+                    )
 
 # ---------- 탭 1: MEC 생성 ----------
 with tab1:
@@ -236,60 +382,87 @@ with tab1:
 
     col1, col2, col3 = st.columns([3, 5, 3])
     with col2:
-        uploaded_file = st.file_uploader("📁 CSV 파일을 업로드하세요", type=["csv"])
+        upload = spooled_upload("single", "📁 CSV/Parquet/Feather/Excel 파일을 업로드하세요")
 
-    if not uploaded_file:
+    if not upload:
         st.info("📂 먼저 CSV 파일을 업로드해주세요.")
         st.stop()
 
-    # ✅ 파일 읽기 및 컬럼 소문자화
-    filename = uploaded_file.name
-    df = pd.read_csv(uploaded_file)
-    df.columns = df.columns.str.lower()
+    # ✅ 파일 읽기 및 검증/생성 (업로드 내용 해시 + 생성기 버전 기준으로 세션에 보관)
+    filename = upload.filename
+    try:
+        single_key = (upload.digest, GENERATOR_VERSION, schema_available())
+        single = session_store.cached(session_id, "single", single_key, lambda: process_single(upload))
+    except (ValueError, ImportError) as e:
+        st.error(f"❌ {e}")
+        st.stop()
 
-    st.success(f"✅ {len(df)}개의 언어 행 로딩 완료!")
+    st.success(f"✅ {single['rows']}개의 언어 행 로딩 완료!")
+
+    # ✅ Summary 글자 수 / ArtReference(worktype=movie) 검증을 한 번에 수행
+    if not single["has_worktype"]:
+        st.warning("⚠️ 'worktype' 컬럼이 없어 ArtReference 검증을 건너뜁니다.")
 
-    # ✅ Summary 글자 수 검증
-    summary_errors = validate_summary_length(df)
-    if summary_errors:
-        st.error(f"❌ Summary 글자 수 제한 초과 항목 발견 ({len(summary_errors)}건)")
-        st.dataframe(pd.DataFrame(summary_errors, columns=["행 번호", "컬럼명", "글자수"]))
-        notify_slack_of_xml_error("Summary 글자 수 초과", filename)
+    validation_errors = single["validation_errors"]
+    if not validation_errors.empty:
+        st.error(f"❌ 검증 오류 발견 ({len(validation_errors)}건)")
+        st.dataframe(validation_errors.rename(columns={
+            "row": "행 번호", "language": "언어", "level": "수준", "rule": "규칙", "column": "컬럼명", "value": "값", "message": "내용"
+        }))
+        error_lines = "\n".join(
+            f"{r.row}행 [{r.language}] {r.column}: {r.message} {r.value}".rstrip() for r in validation_errors.itertuples()
+        )
+        notify_slack_of_xml_error(f"CSV 검증 오류 {len(validation_errors)}건:\n{error_lines}", filename)
         st.stop()
 
-    # ✅ worktype이 movie인 경우에만 ArtReference 검증
-    if 'worktype' in df.columns:
-        movie_rows = df[df['worktype'].str.lower() == 'movie']
-        if not movie_rows.empty:
-            art_errors = validate_art_references(movie_rows)
-            if art_errors:
-                st.error(f"❌ ArtReference 필수 항목 누락 발견 (worktype=movie 기준) ({len(art_errors)}건)")
-                error_df = pd.DataFrame(art_errors, columns=["언어", "누락된 항목"])
-                st.dataframe(error_df)
-                error_lines = "\n".join([f"{row[0]} 누락: {row[1]}" for row in art_errors])
-                slack_message = f"ArtReference 필수 항목 누락 (movie):\n```\n{error_lines}\n```"
-                notify_slack_of_xml_error(slack_message, filename)
-                st.stop()
-    else:
-        st.warning("⚠️ 'worktype' 컬럼이 없어 ArtReference 검증을 건너뜁니다.")
+    # ✅ 경고 (해석하지 못한 날짜/등급은 원래 값 그대로 XML에 들어갑니다)
+    validation_warnings = single["validation_warnings"]
+    if not validation_warnings.empty:
+        st.warning(f"⚠️ 형식 경고 {len(validation_warnings)}건 — 값은 그대로 XML에 들어갑니다.")
+        st.dataframe(validation_warnings.rename(columns={
+            "row": "행 번호", "language": "언어", "level": "수준", "rule": "규칙", "column": "컬럼명", "value": "값", "message": "내용"
+        }))
 
     # ✅ XML 생성 및 유효성 검사
-    generated_xml = generate_mec_xml_from_dataframe(df)
+    generated = single["generated"]
 
-    if is_valid_xml_structure(generated_xml):
+    if generated.valid:
         st.success("✅ XML 구조 유효성 검사 통과!")
     else:
         st.error("❌ XML 구조 오류 발생! 다운로드 전에 확인이 필요합니다.")
-        notify_slack_of_xml_error("XML 구조 오류", filename)
+        notify_slack_of_xml_error(f"XML 구조 오류\n{generated.error}", filename)
+
+    # ✅ MEC XSD 검증 (스키마가 설치된 경우)
+    if generated.valid and "schema_errors" not in single:
+        st.info(f"ℹ️ XSD 검증 비활성 — {schema_error()}")
+    if "schema_errors" in single:
+        schema_errors = single["schema_errors"]
+        if schema_errors.empty:
+            st.success("✅ MEC XSD 검증 통과!")
+        else:
+            st.error(f"❌ MEC XSD 검증 오류 ({len(schema_errors)}건)")
+            st.dataframe(schema_errors.rename(columns={
+                "row": "행 번호", "language": "언어", "column": "컬럼명", "line": "XML 줄", "message": "내용"
+            }))
+            notify_slack_of_xml_error(f"MEC XSD 검증 오류 {len(schema_errors)}건", filename)
+
+    # ✅ 아트 파일 확인 (MEC_ASSET_ROOT가 설정된 경우: 파일 존재 여부와 이미지 크기)
+    if "asset_issues" in single:
+        asset_issues = single["asset_issues"]
+        if asset_issues:
+            st.warning(f"⚠️ 아트 파일 문제 {len(asset_issues)}건 — 다운로드 전에 확인하세요.")
+            st.dataframe(pd.DataFrame(asset_issues))
+        else:
+            st.success("✅ 아트 파일 존재/해상도 확인 통과!")
 
-    # ✅ XML 미리보기 추가
+    # ✅ XML 미리보기 (페이지 단위)
     with st.expander("🔍 XML 내용 미리보기", expanded=True):
-        st.code(generated_xml, language="xml")
+        xml_preview(generated, key=f"preview_page_{upload.digest[:12]}")
 
     # ✅ 다운로드 버튼
     st.download_button(
         label="📥 MEC XML 다운로드",
-        data=generated_xml,
+        data=generated.xml,
         file_name="MEC_Metadata.xml",
         mime="application/xml"
     )
@@ -303,29 +476,40 @@ with tab2:
     # 가운데 정렬용 columns
     col1, col2, col3 = st.columns([3, 6, 3])
     with col2:
-        selected_sample = st.radio("비교할 샘플을 선택하세요:", list(sample_library.keys()), horizontal=True)
-        sample_xml = sample_library.get(selected_sample)
-
-        if sample_xml and generated_xml:
-            sample_paths, err1 = extract_paths(sample_xml)
-            generated_paths, err2 = extract_paths(generated_xml)
-
-            if err1 or err2:
-                st.error(f"XML 파싱 오류\n샘플: {err1}\n생성: {err2}")
+        if generated and sample_indexes:
+            structure = generated.structure
+            with stage("checkpoint"):
+                diffs = diff_all(sample_indexes, structure)
+                matched = best_match(sample_indexes, structure, diffs)
+
+            st.dataframe(pd.DataFrame(
+                [
+                    (("⭐ " if name == matched else "") + name, len(d.missing), len(d.extra), len(d.repeated), len(d.missing_attributes))
+                    for name, d in diffs.items()
+                ],
+                columns=["샘플", "누락 경로", "추가 경로", "반복 오류", "속성 누락"]
+            ), hide_index=True)
+
+            sample_names = list(sample_indexes.keys())
+            selected_sample = st.radio("비교할 샘플을 선택하세요:", sample_names, index=sample_names.index(matched), horizontal=True)
+            diff = diffs[selected_sample]
+
+            if not diff.issue_count:
+                st.success("🎉 XML 구조가 완전히 일치합니다!")
             else:
-                missing = sorted(sample_paths - generated_paths)
-                extra = sorted(generated_paths - sample_paths)
-
-                if not missing and not extra:
-                    st.success("🎉 XML 구조가 완전히 일치합니다!")
-                else:
-                    if missing:
-                        st.warning("🔻 생성 XML에 누락된 태그 경로:")
-                        st.code("\n".join(missing))
-                    if extra:
-                        st.info("🔺 생성 XML에 추가된 태그 경로:")
-                        st.code("\n".join(extra))
-        elif not generated_xml:
+                if diff.missing:
+                    st.warning("🔻 생성 XML에 누락된 태그 경로:")
+                    st.code("\n".join(diff.missing))
+                if diff.extra:
+                    st.info("🔺 생성 XML에 추가된 태그 경로:")
+                    st.code("\n".join(diff.extra))
+                if diff.repeated:
+                    st.warning("🔁 샘플에서는 한 번만 나오지만 생성 XML에서 반복된 태그:")
+                    st.code("\n".join(f"{path} (x{count})" for path, count in diff.repeated))
+                if diff.missing_attributes:
+                    st.warning("🏷️ 샘플에서 필수인 속성이 빠진 태그:")
+                    st.code("\n".join(f"{path}: {', '.join(attrs)}" for path, attrs in diff.missing_attributes))
+        elif not generated:
             st.info("📄 먼저 'MEC XML 생성' 탭에서 CSV를 업로드해주세요.")
 
 
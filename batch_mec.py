@@ -0,0 +1,326 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+import argparse
+import csv
+import io
+import os
+import re
+import sys
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from generate_mec import GENERATOR_VERSION, Title, as_records, build_title, generate_mec_xml
+from mec_assets import ASSET_COLUMNS, check_assets
+from mec_delta import DeltaSink, load_index
+from mec_hierarchy import build_hierarchy, check_hierarchy
+from mec_ingest import catalog_format, filter_records, group_titles, iter_csv_records, iter_titles, read_catalog
+from mec_schema import format_errors, get_schema, validate_xml
+from output_cache import DEFAULT_MAX_BYTES, OutputCache, title_key
+
+REPORT_COLUMNS = ["contentid", "filename", "status", "cached", "error", "warnings"]
+
+
+@dataclass
+class TitleResult:
+    contentid: str
+    filename: str
+    xml: bytes = b""
+    error: str = ""
+    cached: bool = False
+    warnings: str = ""
+
+    @property
+    def ok(self):
+        return not self.error
+
+
+def safe_filename(content_id):
+    name = re.sub(r"[^A-Za-z0-9._-]+", "_", content_id).strip("._")
+    return f"{name or 'untitled'}.xml"
+
+
+def split_titles(data):
+    return group_titles(as_records(data))
+
+
+# (contentid, 행 목록)을 (contentid, Title)로 한 번만 정규화합니다. 정규화에 실패한 타이틀은 행 그대로 두어
+# 생성 단계가 같은 오류를 리포트에 남기게 합니다.
+def normalize_titles(titles):
+    for content_id, rows in titles:
+        if isinstance(rows, Title):
+            yield content_id, rows
+            continue
+        try:
+            yield content_id, build_title(rows)
+        except Exception:
+            yield content_id, rows
+
+
+# 파싱하지 못해 원래 값 그대로 XML에 들어간 값들 (리포트의 warnings 컬럼)
+def format_issues(title):
+    return "; ".join(f"{column}={value!r}" for column, value in title.issues)
+
+
+def _error_result(content_id, e):
+    return TitleResult(content_id, safe_filename(content_id), error=f"{type(e).__name__}: {e}")
+
+
+# title은 행 레코드 list 또는 이미 정규화된 Title입니다.
+# schema=True면 생성된 XML을 MEC XSD로 검증합니다. (스키마는 워커 프로세스마다 한 번 컴파일)
+def generate_title(content_id, title, schema=False):
+    filename = safe_filename(content_id)
+    if not content_id:
+        return TitleResult(content_id, filename, error="contentid 누락")
+    try:
+        if not isinstance(title, Title):
+            title = build_title(title)
+        result = generate_mec_xml(title)
+    except Exception as e:
+        return _error_result(content_id, e)
+    if not result.valid:
+        return TitleResult(content_id, filename, error=f"XML 구조 오류: {result.error}", warnings=format_issues(title))
+    if schema:
+        errors = validate_xml(result.xml, title)
+        if errors:
+            return TitleResult(content_id, filename, error=format_errors(errors), warnings=format_issues(title))
+    return TitleResult(content_id, filename, xml=result.xml, warnings=format_issues(title))
+
+
+def _report_row(r):
+    return dict(zip(REPORT_COLUMNS, (r.contentid, r.filename, "ok" if r.ok else "error", r.cached, r.error, r.warnings)))
+
+
+def rows_csv(rows, columns):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def report_csv(report):
+    return rows_csv(report, REPORT_COLUMNS)
+
+
+class ZipSink:
+    def __init__(self, target):
+        self.zf = zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def add(self, result):
+        if result.ok:
+            self.zf.writestr(result.filename, result.xml)
+
+    def write_file(self, name, data):
+        self.zf.writestr(name, data)
+
+    def close(self, report):
+        self.zf.writestr("report.csv", report_csv(report))
+        self.zf.close()
+
+
+class DirectorySink:
+    def __init__(self, out_dir):
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+
+    def add(self, result):
+        if result.ok:
+            with open(os.path.join(self.out_dir, result.filename), "wb") as f:
+                f.write(result.xml)
+
+    def write_file(self, name, data):
+        with open(os.path.join(self.out_dir, name), "w", encoding="utf-8", newline="") as f:
+            f.write(data)
+
+    def close(self, report):
+        with open(os.path.join(self.out_dir, "report.csv"), "w", encoding="utf-8", newline="") as f:
+            f.write(report_csv(report))
+
+
+def open_sink(output):
+    if output.lower().endswith(".zip"):
+        return ZipSink(output)
+    return DirectorySink(output)
+
+
+def _done(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+# 타이틀을 하나씩 받아 생성하고 완료되는 대로 sink에 기록합니다.
+# 진행 중인 작업 수를 워커 수의 두 배로 제한해 생성된 XML이 메모리에 쌓이지 않게 하며,
+# 리포트용 메타데이터만 남깁니다. 행은 받는 즉시 Title 모델로 정규화해 작업 큐와 워커에는
+# 압축된 값만 전달됩니다. cache(OutputCache)가 주어지면 입력이 바뀌지 않은
+# 타이틀은 워커에 보내지 않고 캐시된 XML을 그대로 씁니다. executor를 넘기면 새 풀을
+# 만들지 않고 그 풀을 사용합니다. schema=True면 XSD 검증을 통과한 XML만 캐시를 따로 씁니다.
+def generate_stream(titles, sink, max_workers=None, cache=None, executor=None, schema=False):
+    version = f"{GENERATOR_VERSION}+xsd" if schema else GENERATOR_VERSION
+    report = []
+    seen = set()
+
+    def emit(result, key=None):
+        if key and result.ok and not result.cached:
+            cache.put(key, result.xml)
+        sink.add(result)
+        report.append(_report_row(result))
+
+    def jobs():
+        for content_id, rows in titles:
+            filename = safe_filename(content_id)
+            if filename in seen:
+                yield content_id, rows, None, TitleResult(content_id, filename, error="contentid/파일명 중복 (행이 연속되지 않았거나 파일명 충돌)")
+                continue
+            seen.add(filename)
+            try:
+                title = rows if isinstance(rows, Title) else build_title(rows)
+            except Exception as e:
+                yield content_id, None, None, _error_result(content_id, e)
+                continue
+            key = title_key(title, version) if cache is not None and content_id else None
+            xml = cache.get(key) if key else None
+            if xml is not None:
+                yield content_id, title, key, TitleResult(content_id, filename, xml=xml, cached=True,
+                                                          warnings=format_issues(title))
+            else:
+                yield content_id, title, key, None
+
+    def run(executor, max_pending):
+        pending = deque()
+        for content_id, title, key, ready in jobs():
+            future = _done(ready) if ready else executor.submit(generate_title, content_id, title, schema)
+            pending.append((future, key))
+            if len(pending) >= max_pending:
+                future, key = pending.popleft()
+                emit(future.result(), key)
+        while pending:
+            future, key = pending.popleft()
+            emit(future.result(), key)
+
+    if executor is not None:
+        run(executor, (max_workers or os.cpu_count() or 1) * 2)
+    elif max_workers == 1:
+        for content_id, title, key, ready in jobs():
+            emit(ready or generate_title(content_id, title, schema), key)
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            run(pool, workers * 2)
+
+    sink.close(report)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 타이틀이 담긴 CSV에서 contentid별 MEC XML을 일괄 생성합니다.")
+    parser.add_argument("input", help="카탈로그 파일 (.csv, .parquet, .feather, .xlsx)")
+    parser.add_argument("-o", "--output", required=True, help="출력 경로 (.zip 또는 디렉터리)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--stream", action="store_true",
+                        help="CSV를 한 행씩 읽어 연속된 contentid 행을 타이틀 하나씩 처리 (대용량 파일용)")
+    parser.add_argument("--contentid", action="append", default=None, help="이 contentid만 생성 (여러 번 또는 쉼표로 구분)")
+    parser.add_argument("--worktype", action="append", default=None, help="이 worktype만 생성 (예: episode)")
+    parser.add_argument("--sheet", action="append", default=None, help="Excel에서 읽을 시트 (기본값: 모든 시트)")
+    parser.add_argument("--hierarchy", action="store_true",
+                        help="시리즈/시즌/에피소드 부모 참조와 번호를 검사하고 계층 순서로 생성 (오류가 있으면 생성하지 않음)")
+    parser.add_argument("--previous", default=None,
+                        help="이전 납품본(디렉터리/ZIP 또는 fingerprints.json)과 비교해 추가/변경된 타이틀만 생성")
+    parser.add_argument("--asset-root", default=None,
+                        help="ArtReference 파일이 있는 폴더. 파일 존재 여부와 이미지 크기를 확인해 assets.csv로 기록")
+    parser.add_argument("--schema", action="store_true",
+                        help="생성된 XML을 MEC XSD로 검증 (lxml 필요, XSD 위치: MEC_SCHEMA_DIR 또는 schemas/)")
+    parser.add_argument("--cache-dir", default=None, help="변경되지 않은 타이틀을 재사용할 출력 캐시 디렉터리")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_MAX_BYTES // 1024 ** 2, help="출력 캐시 최대 크기 (MB)")
+    parser.add_argument("--slack-webhook", default=None, help="실패한 타이틀을 모아 알릴 Slack webhook URL")
+    args = parser.parse_args(argv)
+
+    contentids = [c for value in args.contentid for c in value.split(",") if c.strip()] if args.contentid else None
+    worktypes = [w for value in args.worktype for w in value.split(",") if w.strip()] if args.worktype else None
+    try:
+        fmt = catalog_format(args.input)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.schema:
+        # 워커를 띄우기 전에 XSD/lxml이 준비됐는지 확인합니다.
+        try:
+            get_schema()
+        except (ImportError, OSError, ValueError) as e:
+            parser.error(str(e))
+    if args.stream:
+        if fmt != "csv":
+            parser.error("--stream은 CSV 입력에서만 사용할 수 있습니다.")
+        if args.hierarchy or args.asset_root:
+            parser.error("--hierarchy/--asset-root는 카탈로그 전체가 필요하므로 --stream과 함께 쓸 수 없습니다.")
+        titles = iter_titles(filter_records(iter_csv_records(args.input, project=True), contentids, worktypes))
+    else:
+        titles = split_titles(read_catalog(args.input, fmt, contentids, worktypes, args.sheet))
+    if args.hierarchy:
+        hierarchy = build_hierarchy(titles)
+        issues = check_hierarchy(hierarchy)
+        for issue in issues:
+            print(f"  [{issue['level']}] {issue['contentid']} ({issue['worktype']}) {issue['rule']}: "
+                  f"{issue['message']} {issue['value']}".rstrip(), file=sys.stderr)
+        errors = [issue for issue in issues if issue["level"] == "error"]
+        if errors:
+            print(f"계층 검사 오류 {len(errors)}건 — 생성하지 않았습니다.", file=sys.stderr)
+            return 2
+        titles = hierarchy.ordered()
+    sink = open_sink(args.output)
+    asset_issues = []
+    if args.asset_root:
+        titles = list(normalize_titles(titles))
+        asset_issues = check_assets(titles, args.asset_root)
+        sink.write_file("assets.csv", rows_csv(asset_issues, ASSET_COLUMNS))
+
+    delta = None
+    if args.previous:
+        previous, unreadable = load_index(args.previous, args.workers)
+        for path, error in unreadable:
+            print(f"  이전 납품본을 읽지 못함 {path}: {error}", file=sys.stderr)
+        delta = DeltaSink(sink, previous, complete=not (contentids or worktypes))
+        titles, sink = delta.select(titles), delta
+
+    cache = OutputCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 ** 2) if args.cache_dir else None
+    report = generate_stream(titles, sink, max_workers=args.workers, cache=cache, schema=args.schema)
+
+    failed = [r for r in report if r["status"] == "error"]
+    print(f"{len(report) - len(failed)}/{len(report)} titles generated -> {args.output}")
+    if delta is not None:
+        counts = delta.summary()
+        print(f"delta: {counts['added']} added / {counts['changed']} changed / {counts['removed']} removed, "
+              f"{counts['unchanged']} unchanged")
+    if cache is not None:
+        stats = cache.stats()
+        print(f"cache: {stats['hits']} hits / {stats['misses']} misses, {stats['evictions']} evicted, "
+              f"{stats['size_bytes'] / 1024 ** 2:.1f} MB")
+    for r in failed:
+        print(f"  {r['contentid'] or '(empty)'}: {r['error']}", file=sys.stderr)
+    if args.asset_root:
+        print(f"assets: {len(asset_issues)} issues (assets.csv)")
+        for issue in asset_issues:
+            print(f"  {issue['contentid']} [{issue['language']}] {issue['purpose']} {issue['file']}: {issue['message']} "
+                  f"{issue['expected']} {issue['actual']}".rstrip(), file=sys.stderr)
+
+    if args.slack_webhook and failed:
+        from slack_notifier import SlackNotifier
+
+        notifier = SlackNotifier(args.slack_webhook)
+        for r in failed:
+            notifier.notify(f"{r['contentid'] or '(empty)'}: {r['error']}", os.path.basename(args.input))
+        notifier.close(timeout=60)
+    return 1 if failed or asset_issues else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
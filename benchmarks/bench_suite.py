@@ -0,0 +1,176 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# 사용법:
+#   python -m benchmarks.bench_suite                  # 실행 후 baseline.json과 비교
+#   python -m benchmarks.bench_suite --quick          # 타이틀 수를 1/10로 줄여 빠르게 실행
+#   python -m benchmarks.bench_suite --save-baseline  # 현재 결과를 baseline.json으로 저장
+
+import argparse
+import gc
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import NamedTuple
+
+import pandas as pd
+
+from batch_mec import split_titles
+from benchmarks.synthetic import SAMPLE_PATHS, make_catalog
+from generate_mec import (
+    build_people_index,
+    collect_multilingual_names,
+    generate_mec_xml,
+    people_columns,
+    to_date_string,
+    to_str,
+)
+from mec_ingest import read_csv_records
+from mec_structure import diff_structure, load_sample_indexes
+from mec_validation import validate_dataframe
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# 이보다 짧은 단계는 측정 잡음이 커서 회귀 판정에서 제외합니다.
+MIN_SECONDS = 0.005
+
+
+class Scenario(NamedTuple):
+    name: str
+    titles: int
+    languages: int
+    genres: int
+    actors: int
+    fixture: str
+
+
+SCENARIOS = [
+    Scenario("movie_1lang", 500, 1, 1, 6, "Movie"),
+    Scenario("movie_15lang", 200, 15, 3, 6, "Movie"),
+    Scenario("movie_40lang", 50, 40, 3, 6, "Movie"),
+    Scenario("genres_10", 200, 5, 10, 6, "Movie"),
+    Scenario("series_30actors", 50, 15, 3, 30, "Series"),
+    Scenario("episodes_2000", 2000, 3, 2, 6, "Episode"),
+]
+
+
+def _stages(catalog, csv_bytes):
+    records = read_csv_records(csv_bytes)
+    first_title = next(split_titles(records))[1]
+    roles = people_columns(first_title[0].keys())
+    cells = catalog.to_numpy().ravel().tolist()
+    dates = catalog["releasedate"].tolist()
+
+    def generate_all():
+        return [generate_mec_xml(rows) for _, rows in split_titles(records)]
+
+    return {
+        "read_csv": lambda: pd.read_csv(io.BytesIO(csv_bytes)),
+        "read_csv_records": lambda: read_csv_records(csv_bytes),
+        "to_str": lambda: [to_str(v) for v in cells],
+        "to_date_string": lambda: [to_date_string(v) for v in dates],
+        "collect_multilingual_names": lambda: [collect_multilingual_names(first_title, r) for r in roles],
+        "build_people_index": lambda: build_people_index(first_title),
+        "validate": lambda: validate_dataframe(catalog.copy()),
+        "generate": generate_all,
+    }
+
+
+# 시간은 tracemalloc 없이, 최대 메모리는 tracemalloc을 켠 별도 실행으로 측정합니다.
+def measure(func):
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": round(seconds, 6), "peak_kb": round(peak / 1024, 1)}
+
+
+def run_scenario(scenario, scale=1.0):
+    titles = max(1, int(scenario.titles * scale))
+    catalog = make_catalog(titles, scenario.languages, scenario.genres, scenario.actors, scenario.fixture)
+    csv_bytes = catalog.to_csv(index=False).encode("utf-8")
+
+    results = {stage: measure(func) for stage, func in _stages(catalog, csv_bytes).items()}
+
+    # 번들 샘플을 구조 기준으로 사용: 첫 타이틀의 생성 구조를 같은 WorkType 샘플과 비교
+    sample = load_sample_indexes({scenario.fixture: SAMPLE_PATHS[scenario.fixture]})[scenario.fixture]
+    generated = generate_mec_xml(next(split_titles(read_csv_records(csv_bytes)))[1])
+    diff = diff_structure(sample, generated.structure)
+    results["structure_issues"] = diff.issue_count
+    results["rows"] = len(catalog)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for scenario, stages in results.items():
+        for stage, current in stages.items():
+            previous = baseline.get(scenario, {}).get(stage)
+            if not isinstance(current, dict) or not previous:
+                continue
+            if current["seconds"] >= MIN_SECONDS and current["seconds"] > previous["seconds"] * (1 + tolerance):
+                regressions.append((scenario, stage, "seconds", previous["seconds"], current["seconds"]))
+            if current["peak_kb"] > previous["peak_kb"] * (1 + tolerance):
+                regressions.append((scenario, stage, "peak_kb", previous["peak_kb"], current["peak_kb"]))
+    return regressions
+
+
+def print_results(results):
+    print(f"{'scenario':<18} {'stage':<28} {'seconds':>10} {'peak MB':>10}")
+    for scenario, stages in results.items():
+        for stage, value in stages.items():
+            if isinstance(value, dict):
+                print(f"{scenario:<18} {stage:<28} {value['seconds']:>10.4f} {value['peak_kb'] / 1024:>10.2f}")
+        print(f"{scenario:<18} {'rows':<28} {stages['rows']:>10}")
+        print(f"{scenario:<18} {'structure_issues':<28} {stages['structure_issues']:>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MEC 생성기/검증기 벤치마크")
+    parser.add_argument("--quick", action="store_true", help="타이틀 수를 1/10로 줄여 실행")
+    parser.add_argument("--only", nargs="*", help="실행할 시나리오 이름")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="회귀로 판정할 증가 비율 (기본 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    scale = 0.1 if args.quick else 1.0
+    scenarios = [s for s in SCENARIOS if not args.only or s.name in args.only]
+    results = {s.name: run_scenario(s, scale) for s in scenarios}
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"baseline saved -> {args.baseline}")
+        return 0
+
+    if args.quick or not os.path.exists(args.baseline):
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    for scenario, stage, metric, before, after in regressions:
+        print(f"REGRESSION {scenario}/{stage} {metric}: {before} -> {after}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# 사용법: python -m benchmarks.bench_validation [행 수]
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from mec_validation import validate_dataframe
+
+
+# ---------- 이전 iterrows 기반 검증 함수 (비교 기준) ----------
+def legacy_validate_summary_length(df):
+    errors = []
+    for i, row in df.iterrows():
+        s190 = str(row.get("summary190", ""))
+        s400 = str(row.get("summary400", ""))
+        if len(s190) > 190:
+            errors.append((i + 2, "summary190", len(s190)))
+        if len(s400) > 400:
+            errors.append((i + 2, "summary400", len(s400)))
+    return errors
+
+
+def legacy_validate_art_references(df):
+    errors = []
+    for idx, row in df.iterrows():
+        language = str(row.get("Language", f"행 {idx+2}")).strip()
+        missing = []
+        for tag in ["boxart", "cover", "poster"]:
+            value = row.get(tag)
+            if pd.isna(value) or str(value).strip() == "":
+                missing.append(tag)
+        if missing:
+            errors.append((language, ", ".join(missing)))
+    return errors
+
+
+def legacy_validate(df):
+    summary = legacy_validate_summary_length(df)
+    movie_rows = df[df["worktype"].str.lower() == "movie"]
+    return summary, legacy_validate_art_references(movie_rows)
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    lengths190 = rng.integers(50, 200, rows)
+    lengths400 = rng.integers(100, 420, rows)
+    art = np.where(rng.random(rows) < 0.02, None, "art.jpg")
+    return pd.DataFrame({
+        "contentid": [f"title_{i // 10}" for i in range(rows)],
+        "language": rng.choice(["en-US", "ko-KR", "ja-JP", "id-ID"], rows),
+        "worktype": rng.choice(["movie", "episode"], rows),
+        "summary190": ["a" * n for n in lengths190],
+        "summary400": ["b" * n for n in lengths400],
+        "boxart": art,
+        "cover": np.roll(art, 1),
+        "poster": np.roll(art, 2),
+    })
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    rows = int(argv[0]) if argv else 100_000
+    df = make_frame(rows)
+
+    _, legacy_time = timed(legacy_validate, df)
+    errors, engine_time = timed(validate_dataframe, df)
+
+    print(f"rows:            {rows:,}")
+    print(f"errors found:    {len(errors):,}")
+    print(f"legacy iterrows: {legacy_time * 1000:10.1f} ms")
+    print(f"rule engine:     {engine_time * 1000:10.1f} ms")
+    print(f"speedup:         {legacy_time / engine_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# 번들 샘플 XML(Movie/Series/Season/Episode)의 실제 값으로 합성 카탈로그를 만듭니다.
+
+import os
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+
+import pandas as pd
+
+from mec_structure import NAMESPACES, SAMPLE_FILES
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_PATHS = {name: os.path.join(REPO_ROOT, filename) for name, filename in SAMPLE_FILES.items()}
+
+LANGUAGES = [
+    "en-US", "ko-KR", "ja-JP", "zh-TW", "zh-CN", "th-TH", "ms-MY", "id-ID", "vi-VN", "hi-IN",
+    "ar-SA", "tr-TR", "pt-BR", "pt-PT", "es-419", "es-ES", "fr-FR", "fr-CA", "it-IT", "de-DE",
+    "nl-NL", "sv-SE", "da-DK", "nb-NO", "fi-FI", "pl-PL", "cs-CZ", "hu-HU", "ro-RO", "el-GR",
+    "he-IL", "ru-RU", "uk-UA", "ta-IN", "te-IN", "fil-PH", "en-GB", "en-IN", "en-AU", "ko-US",
+]
+ART_TAGS = ["boxart", "cover", "hero", "poster"]
+
+
+@lru_cache(maxsize=None)
+def load_fixture(name):
+    root = ET.parse(SAMPLE_PATHS[name]).getroot()
+    ns = NAMESPACES
+    loc = root.find(".//md:LocalizedInfo", ns)
+    ratings = [
+        ":".join([
+            r.findtext("md:Region/md:country", "", ns),
+            r.findtext("md:System", "", ns),
+            r.findtext("md:Value", "", ns),
+        ])
+        for r in root.iterfind(".//md:RatingSet/md:Rating", ns)
+    ]
+    parent = root.findtext(".//md:Parent/md:ParentContentID", "", ns)
+    return {
+        "worktype": root.findtext(".//md:WorkType", "", ns),
+        "title": loc.findtext("md:TitleDisplayUnlimited", "", ns).strip(),
+        "summary190": loc.findtext("md:Summary190", "", ns),
+        "summary400": loc.findtext("md:Summary400", "", ns),
+        "art": {a.get("purpose"): a.text for a in loc.iterfind("md:ArtReference", ns)},
+        "genres": [g.get("id") for g in root.iterfind(".//md:Genre", ns)] or ["av_genre_drama"],
+        "names": [d.text for d in root.iterfind(".//md:People/md:Name/md:DisplayName", ns)] or ["Name"],
+        "ratinginfo": ";".join(ratings),
+        "releaseyear": root.findtext(".//md:ReleaseYear", "", ns),
+        "releasedate": root.findtext(".//md:ReleaseDate", "", ns),
+        "originallanguage": root.findtext(".//md:OriginalLanguage", "", ns),
+        "orgid": root.find(".//md:AssociatedOrg", ns).get("organizationID", ""),
+        "displaystring": root.findtext(".//mdmec:CompanyDisplayCredit/md:DisplayString", "", ns),
+        "sequencenumber": root.findtext(".//md:SequenceInfo/md:Number", "", ns),
+        "parentcontentid": parent.replace("md:cid:org:", "", 1),
+    }
+
+
+def make_catalog(titles=100, languages=5, genres=3, actors=6, fixture="Movie"):
+    f = load_fixture(fixture)
+    langs = LANGUAGES[:languages]
+    names = f["names"]
+    rows = []
+    for t in range(titles):
+        content_id = f"bench:{fixture.lower()}_{t:06d}"
+        for i, lang in enumerate(langs):
+            row = {
+                "contentid": content_id,
+                "language": lang,
+                "title": f"{f['title']} {t}",
+                "worktype": f["worktype"],
+                "summary190": f["summary190"],
+                "summary400": f["summary400"],
+                "releaseyear": f["releaseyear"],
+                "releasedate": f["releasedate"].replace("-", "."),
+                "altid_org": content_id,
+                "ratinginfo": f["ratinginfo"],
+                "originallanguage": f["originallanguage"],
+                "orgid": f["orgid"],
+                "displaystring": f["displaystring"],
+                "sequencenumber": f["sequencenumber"],
+                "parentcontentid": f["parentcontentid"],
+                "director": names[i % len(names)],
+                "writer": names[(i + 1) % len(names)],
+            }
+            for tag in ART_TAGS:
+                if tag in f["art"]:
+                    row[tag] = f"{lang}-{f['art'][tag]}"
+            for g in range(genres):
+                row[f"genre{g + 1}"] = f["genres"][g % len(f["genres"])]
+            for a in range(actors):
+                row[f"actor{a + 1}"] = f"{names[(i + a) % len(names)]} {a + 1}"
+            rows.append(row)
+    return pd.DataFrame(rows)
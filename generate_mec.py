@@ -9,187 +9,401 @@
 # ------------------------------------------------------------------------------
 
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
-import pandas as pd
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+import math
 import re
+from html import escape
+from mec_metrics import stage
+from mec_structure import NAMESPACES, PathIndex
+
+# 생성 코어는 pandas 없이 행 레코드(소문자 컬럼명 → 값 dict의 list)로 동작합니다.
+# pandas DataFrame은 as_records()로 변환해서 받습니다.
+
+# 생성 로직이 바뀌어 출력이 달라지면 올려서 캐시된 결과를 무효화합니다.
+GENERATOR_VERSION = "4"
+
+XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>\n'
+_INVALID_XML_CHARS = re.compile("[^\u0009\u000a\u000d\u0020-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+
+@dataclass(frozen=True)
+class MecXmlResult:
+    xml: bytes
+    valid: bool = True
+    error: str = ""
+    line: Optional[int] = None
+    column: Optional[int] = None
+    structure: Optional[PathIndex] = None
+
+    @property
+    def text(self):
+        return self.xml.decode("utf-8")
+
+def _is_missing(v):
+    if v is None:
+        return True
+    if isinstance(v, float):
+        return math.isnan(v)
+    # pandas.NA / pandas.NaT (pandas를 import하지 않고 판별)
+    return type(v).__name__ in ("NAType", "NaTType")
+
+def as_records(data):
+    if isinstance(data, list):
+        return data
+    data.columns = data.columns.str.lower()
+    # 셀마다 to_str()을 부르지 않고 컬럼 단위로 한 번에 정리합니다. (NaN → "", 끝의 ".0" 제거)
+    text = data.astype(str).where(data.notna(), "")
+    for col in text.columns:
+        text[col] = text[col].str.replace(r"\.0$", "", regex=True)
+    return text.to_dict("records")
 
 def to_str(v):
-    if pd.isna(v):
+    if _is_missing(v):
         return ""
     v_str = str(v)
     if v_str.endswith(".0"):
         return v_str[:-2]
     return v_str
 
-def to_date_string(v):
+def _date_text(v):
+    if _is_missing(v):
+        return ""
+    if hasattr(v, "strftime"):
+        # Excel/Parquet의 date, datetime 값
+        return v.strftime("%Y-%m-%d")
+    if isinstance(v, float) and math.isfinite(v):
+        return str(int(v))
+    return str(v)
+
+# 카탈로그는 같은 날짜/등급 문자열을 반복해서 쓰므로 파싱 결과를 캐시합니다.
+# (값, 파싱 성공 여부)를 돌려주며 실패하면 원래 값을 그대로 씁니다.
+@lru_cache(maxsize=4096)
+def parse_date(text):
+    if not text:
+        return "", True
+    text = text.replace(".", "-")
     try:
-        if isinstance(v, float):
-            v = str(int(v))
-        v = str(v).replace(".", "-")
-        dt = datetime.strptime(v, "%Y-%m-%d")
-        return dt.strftime("%Y-%m-%d")
-    except:
-        return to_str(v)
-
-def collect_multilingual_names(df, role_column):
+        return datetime.strptime(text, "%Y-%m-%d").strftime("%Y-%m-%d"), True
+    except ValueError:
+        return to_str(text), False
+
+def to_date_string(v):
+    return parse_date(_date_text(v))[0]
+
+def collect_multilingual_names(rows, role_column):
     lang_map = {}
-    for _, row in df.iterrows():
+    for row in as_records(rows):
         lang = to_str(row.get("language"))
         name = to_str(row.get(role_column.lower()))
         if name:
             lang_map[lang] = name
     return lang_map
 
-def highlight_invalid_xml(xml_string):
-    try:
-        ET.fromstring(xml_string)
-        return xml_string
-    except ET.ParseError as e:
-        error_msg = str(e)
-        match = re.search(r'line (\d+), column (\d+)', error_msg)
-        lines = xml_string.splitlines()
-        highlighted = []
-        for i, line in enumerate(lines, start=1):
-            prefix = f"{i:4d}: "
-            if match and i == int(match.group(1)):
-                highlighted.append(f"<span style='color:red'>{prefix}{line}</span>")
-            else:
-                highlighted.append(f"{prefix}{line}")
-        return f"<div><strong style='color:red'>Invalid XML:</strong> {error_msg}</div><pre style='white-space:pre-wrap;'>" + "\n".join(highlighted) + "</pre>"
+PEOPLE_COLUMN = re.compile(r"^(director|writer|actor)(\d*)$")
+JOB_FUNCTIONS = ["Director", "Writer", "Actor"]
+
+def people_columns(columns):
+    found = []
+    for col in columns:
+        match = PEOPLE_COLUMN.match(col)
+        if match:
+            job_function = match.group(1).capitalize()
+            found.append((JOB_FUNCTIONS.index(job_function), int(match.group(2) or 0), col))
+    return [col for _, _, col in sorted(found)]
+
+# columns를 주지 않으면 모든 행의 컬럼 합집합을 씁니다. (행마다 키가 다른 JSON/여러 시트 입력)
+def build_people_index(rows, columns=None):
+    rows = as_records(rows)
+    if columns is None:
+        columns = dict.fromkeys(col for row in rows for col in row)
+    columns = people_columns(columns)
+    index = {col: {} for col in columns}
+    for row in rows:
+        lang = to_str(row.get("language"))
+        for col in columns:
+            name = to_str(row.get(col))
+            if name:
+                index[col][lang] = name
+    return {role: lang_map for role, lang_map in index.items() if lang_map}
+
+# start/end(1부터, 포함)로 일부 줄만 렌더링할 수 있습니다.
+def highlight_invalid_xml(result: MecXmlResult, start=1, end=None):
+    highlighted = []
+    lines = result.text.splitlines()[start - 1:end]
+    for i, line in enumerate(lines, start=start):
+        prefix = f"{i:4d}: "
+        if i == result.line:
+            highlighted.append(f"<span style='color:red'>{prefix}{escape(line)}</span>")
+        else:
+            highlighted.append(f"{prefix}{escape(line)}")
+    return f"<div><strong style='color:red'>Invalid XML:</strong> {escape(result.error)}</div><pre style='white-space:pre-wrap;'>" + "\n".join(highlighted) + "</pre>"
+
+def _has_invalid_chars(elem):
+    values = [elem.text, elem.tail, *elem.attrib.values()]
+    return any(v and _INVALID_XML_CHARS.search(v) for v in values)
+
+def _indent_tree(elem, index, invalid, level=0, path="", space="  "):
+    current = f"{path}/{elem.tag}"
+    index.add(current, elem)
+    if not invalid and _has_invalid_chars(elem):
+        invalid.append(elem)
+    if len(elem):
+        child_indent = "\n" + space * (level + 1)
+        if not elem.text or not elem.text.strip():
+            elem.text = child_indent
+        child_counts = {}
+        for child in elem:
+            child_path = _indent_tree(child, index, invalid, level + 1, current, space)
+            child_counts[child_path] = child_counts.get(child_path, 0) + 1
+            if not child.tail or not child.tail.strip():
+                child.tail = child_indent
+        child.tail = "\n" + space * level
+        index.add_siblings(child_counts)
+    return current
+
+def serialize_mec_tree(root):
+    index = PathIndex()
+    invalid = []
+    _indent_tree(root, index, invalid)
+    xml = XML_DECLARATION + ET.tostring(root, encoding="utf-8")
+    if not invalid:
+        return MecXmlResult(xml, structure=index)
+
+    text = xml.decode("utf-8")
+    match = _INVALID_XML_CHARS.search(text)
+    if match:
+        position = match.start()
+    else:
+        # 짝이 없는 서로게이트는 UTF-8로 쓸 수 없어 tostring()이 "&#55296;" 같은 문자 참조로 바꿉니다.
+        elem = invalid[0]
+        char = next(c for v in (elem.text, elem.tail, *elem.attrib.values()) if v for c in v if _INVALID_XML_CHARS.match(c))
+        position = max(text.find(f"&#{ord(char)};"), 0)
+    line = text.count("\n", 0, position) + 1
+    column = position - (text.rfind("\n", 0, position) + 1)
+    error = f"not well-formed (invalid token) in <{invalid[0].tag}>: line {line}, column {column}"
+    return MecXmlResult(xml, valid=False, error=error, line=line, column=column, structure=index)
 
 def validate_summary_length(df):
-    errors = []
-    for idx, row in df.iterrows():
-        s190 = to_str(row.get("summary190"))
-        s400 = to_str(row.get("summary400"))
-        if len(s190) > 190:
-            errors.append((idx + 2, "Summary190", len(s190)))
-        if len(s400) > 400:
-            errors.append((idx + 2, "Summary400", len(s400)))
-    return errors
-
-def generate_mec_xml_from_dataframe(df: pd.DataFrame):
-    df.columns = df.columns.str.lower()
-
-    nsmap = {
-        "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
-        "xmlns:md": "http://www.movielabs.com/schema/md/v2.6/md",
-        "xmlns:mdmec": "http://www.movielabs.com/schema/mdmec/v2.6",
-        "xsi:schemaLocation": "http://www.movielabs.com/schema/mdmec/v2.6/mdmec-v2.6.xsd"
-    }
+    from mec_validation import validate_dataframe
 
-    root = ET.Element("mdmec:CoreMetadata", nsmap)
-    base = df.iloc[0]
-    work_type = to_str(base.get("worktype", "")).strip().lower()
+    errors = validate_dataframe(df, rules=["summary190_length", "summary400_length"])
+    columns = errors["column"].str.capitalize()
+    return list(zip(errors["row"].tolist(), columns.tolist(), errors["value"].tolist()))
+
+class ArtReference(NamedTuple):
+    purpose: str
+    resolution: str
+    file: str
+
+class LocalizedInfo(NamedTuple):
+    language: str
+    title: str
+    art: Tuple[ArtReference, ...]
+    summary190: str
+    summary400: str
+    genres: Tuple[str, ...]
 
-    basic = ET.SubElement(root, "mdmec:Basic", {
-        "ContentID": f"md:cid:org:{to_str(base.get('contentid'))}"
-    })
+class Rating(NamedTuple):
+    country: str
+    system: str
+    value: str
 
-    for _, row in df.iterrows():
+class Person(NamedTuple):
+    job_function: str
+    billing_order: int
+    names: Tuple[Tuple[str, str], ...]
+
+# 타이틀 하나의 정규화된 값. 문자열 정리는 build_title()에서 끝내고
+# emit_mec_tree()는 이 값만 사용합니다.
+class Title(NamedTuple):
+    content_id: str
+    work_type: str
+    localized: Tuple[LocalizedInfo, ...]
+    release_year: str
+    release_date: str
+    alt_id: str
+    ratings: Tuple[Rating, ...]
+    people: Tuple[Person, ...]
+    original_language: str
+    org_id: str
+    sequence_number: str
+    parent_id: str
+    display_string: str
+    # 파싱하지 못해 원래 값을 그대로 쓴 (컬럼, 값) 목록
+    issues: Tuple[Tuple[str, str], ...] = ()
+
+    @property
+    def work_type_key(self):
+        return self.work_type.strip().lower()
+
+# (등급 tuple, 형식이 맞지 않는 항목 tuple)
+@lru_cache(maxsize=1024)
+def parse_ratings(text):
+    ratings = []
+    invalid = []
+    for r in text.split(";"):
+        parts = r.strip().split(":")
+        if len(parts) == 3:
+            ratings.append(Rating(*parts))
+        elif r.strip():
+            invalid.append(r.strip())
+    return tuple(ratings), tuple(invalid)
+
+ART_TAGS = ["boxart", "cover", "hero", "poster"]
+
+# ArtReference의 resolution 속성 ("가로x세로"). 아트 파일 검사(mec_assets)도 이 값을 기준으로 합니다.
+def art_resolution(tag, work_type):
+    work_type = work_type.strip().lower()
+    if tag == "boxart":
+        if work_type == "movie":
+            return "1920x2560"
+        return "2560x1920"
+    if tag == "poster":
+        return "2000x3000"
+    if tag == "cover" and work_type == "episode":
+        return "1920x1080"
+    return "3840x2160"
+
+def build_title(rows):
+    rows = as_records(rows)
+    base = rows[0]
+    work_type = to_str(base.get("worktype"))
+    work_type_key = work_type.strip().lower()
+    columns = list(dict.fromkeys(col for row in rows for col in row))
+    genre_columns = [col for col in columns if col.startswith("genre")]
+
+    localized = []
+    for row in rows:
         lang = to_str(row.get("language"))
         if not lang:
             continue
 
-        loc = ET.SubElement(basic, "md:LocalizedInfo", {"language": lang})
-        ET.SubElement(loc, "md:TitleDisplayUnlimited").text = to_str(row.get("title"))
-        ET.SubElement(loc, "md:TitleSort")
-
-        for tag in ["boxart", "cover", "hero", "poster"]:
-            if pd.notna(row.get(tag)):
-                if tag == "boxart":
-                    if work_type == "movie":
-                        res = "1920x2560"
-                    else:
-                        res = "2560x1920"
-                elif tag == "poster":
-                    res = "2000x3000"
-                elif tag == "cover" and work_type == "episode":
-                    res = "1920x1080"
-                else:
-                    res = "3840x2160"
-
-                art_ref_element = ET.SubElement(loc, "md:ArtReference", {
-                    "resolution": res,
-                    "purpose": tag
-                })
-                art_ref_element.text = to_str(row[tag])
-
-        ET.SubElement(loc, "md:Summary190").text = to_str(row.get("summary190"))
-        ET.SubElement(loc, "md:Summary400").text = to_str(row.get("summary400"))
-
-        genre_columns = [col for col in df.columns if col.startswith("genre")]
-        for genre_col in genre_columns:
-            genre_id = to_str(row.get(genre_col))
-            if genre_id:
-                ET.SubElement(loc, "md:Genre", {"id": genre_id}).text = " "
-
-    ET.SubElement(basic, "md:ReleaseYear").text = to_str(base.get("releaseyear"))
-    ET.SubElement(basic, "md:ReleaseDate").text = to_date_string(base.get("releasedate"))
-    ET.SubElement(basic, "md:WorkType").text = to_str(base.get("worktype"))
-
-    alt = ET.SubElement(basic, "md:AltIdentifier")
-    ET.SubElement(alt, "md:Namespace").text = "ORG"
-    ET.SubElement(alt, "md:Identifier").text = to_str(base.get("altid_org"))
-
-    rating_set = ET.SubElement(basic, "md:RatingSet")
-    ratings = to_str(base.get("ratinginfo")).split(";")
-    for r in ratings:
-        parts = r.strip().split(":")
-        if len(parts) == 3:
-            country, system, value = parts
-            rating = ET.SubElement(rating_set, "md:Rating")
-            region = ET.SubElement(rating, "md:Region")
-            ET.SubElement(region, "md:country").text = country
-            ET.SubElement(rating, "md:System").text = system
-            ET.SubElement(rating, "md:Value").text = value
-
-    roles = ["Director", "Writer"] + [f"Actor{i}" for i in range(1, 7)]
-    billing_counters = {"Director": 1, "Writer": 1, "Actor": 1}
-
-    for role in roles:
-        lang_name_map = collect_multilingual_names(df, role)
-        if lang_name_map:
-            person = ET.SubElement(basic, "md:People")
-            job = ET.SubElement(person, "md:Job")
-            job_function = "Actor" if "actor" in role.lower() else role
-            ET.SubElement(job, "md:JobFunction").text = job_function
-            ET.SubElement(job, "md:BillingBlockOrder").text = str(billing_counters[job_function])
-            billing_counters[job_function] += 1
-
-            name_tag = ET.SubElement(person, "md:Name")
-            for lang, name in lang_name_map.items():
-                ET.SubElement(name_tag, "md:DisplayName", {"language": lang}).text = name
-
-    ET.SubElement(basic, "md:OriginalLanguage").text = to_str(base.get("originallanguage"))
-    ET.SubElement(basic, "md:AssociatedOrg", {
-        "organizationID": to_str(base.get("orgid")),
-        "role": "licensor"
-    })
+        art = []
+        for tag in ART_TAGS:
+            art_file = to_str(row.get(tag))
+            if art_file:
+                art.append(ArtReference(tag, art_resolution(tag, work_type_key), art_file))
 
-    if work_type in ["season", "episode"]:
-        seq_number = to_str(base.get("sequencenumber"))
-        parent_id = to_str(base.get("parentcontentid"))
+        genres = tuple(g for g in (to_str(row.get(col)) for col in genre_columns) if g)
+        localized.append(LocalizedInfo(
+            lang,
+            to_str(row.get("title")),
+            tuple(art),
+            to_str(row.get("summary190")),
+            to_str(row.get("summary400")),
+            genres,
+        ))
+
+    issues = []
+    date_text = _date_text(base.get("releasedate"))
+    release_date, ok = parse_date(date_text)
+    if not ok:
+        issues.append(("releasedate", date_text))
+    ratings, invalid = parse_ratings(to_str(base.get("ratinginfo")))
+    issues.extend(("ratinginfo", r) for r in invalid)
 
-        if seq_number:
-            seq_info = ET.SubElement(basic, "md:SequenceInfo")
-            ET.SubElement(seq_info, "md:Number").text = seq_number
+    billing_counters = {job_function: 1 for job_function in JOB_FUNCTIONS}
+    people = []
+    for role, lang_name_map in build_people_index(rows, columns).items():
+        job_function = PEOPLE_COLUMN.match(role).group(1).capitalize()
+        people.append(Person(job_function, billing_counters[job_function], tuple(lang_name_map.items())))
+        billing_counters[job_function] += 1
+
+    return Title(
+        content_id=to_str(base.get("contentid")),
+        work_type=work_type,
+        localized=tuple(localized),
+        release_year=to_str(base.get("releaseyear")),
+        release_date=release_date,
+        alt_id=to_str(base.get("altid_org")),
+        ratings=ratings,
+        people=tuple(people),
+        original_language=to_str(base.get("originallanguage")),
+        org_id=to_str(base.get("orgid")),
+        sequence_number=to_str(base.get("sequencenumber")),
+        parent_id=to_str(base.get("parentcontentid")),
+        display_string=to_str(base.get("displaystring")),
+        issues=tuple(issues),
+    )
+
+def emit_mec_tree(title):
+    nsmap = {f"xmlns:{prefix}": uri for prefix, uri in NAMESPACES.items()}
+    nsmap["xsi:schemaLocation"] = "http://www.movielabs.com/schema/mdmec/v2.6/mdmec-v2.6.xsd"
+
+    root = ET.Element("mdmec:CoreMetadata", nsmap)
+    SubElement = ET.SubElement
+
+    basic = SubElement(root, "mdmec:Basic", {"ContentID": f"md:cid:org:{title.content_id}"})
+
+    for info in title.localized:
+        loc = SubElement(basic, "md:LocalizedInfo", {"language": info.language})
+        SubElement(loc, "md:TitleDisplayUnlimited").text = info.title
+        SubElement(loc, "md:TitleSort")
+        for art in info.art:
+            SubElement(loc, "md:ArtReference", {"resolution": art.resolution, "purpose": art.purpose}).text = art.file
+        SubElement(loc, "md:Summary190").text = info.summary190
+        SubElement(loc, "md:Summary400").text = info.summary400
+        for genre_id in info.genres:
+            SubElement(loc, "md:Genre", {"id": genre_id}).text = " "
+
+    SubElement(basic, "md:ReleaseYear").text = title.release_year
+    SubElement(basic, "md:ReleaseDate").text = title.release_date
+    SubElement(basic, "md:WorkType").text = title.work_type
+
+    alt = SubElement(basic, "md:AltIdentifier")
+    SubElement(alt, "md:Namespace").text = "ORG"
+    SubElement(alt, "md:Identifier").text = title.alt_id
+
+    rating_set = SubElement(basic, "md:RatingSet")
+    for r in title.ratings:
+        rating = SubElement(rating_set, "md:Rating")
+        region = SubElement(rating, "md:Region")
+        SubElement(region, "md:country").text = r.country
+        SubElement(rating, "md:System").text = r.system
+        SubElement(rating, "md:Value").text = r.value
+
+    for p in title.people:
+        person = SubElement(basic, "md:People")
+        job = SubElement(person, "md:Job")
+        SubElement(job, "md:JobFunction").text = p.job_function
+        SubElement(job, "md:BillingBlockOrder").text = str(p.billing_order)
+        name_tag = SubElement(person, "md:Name")
+        for lang, name in p.names:
+            SubElement(name_tag, "md:DisplayName", {"language": lang}).text = name
+
+    SubElement(basic, "md:OriginalLanguage").text = title.original_language
+    SubElement(basic, "md:AssociatedOrg", {"organizationID": title.org_id, "role": "licensor"})
+
+    work_type = title.work_type_key
+    if work_type in ["season", "episode"]:
+        if title.sequence_number:
+            seq_info = SubElement(basic, "md:SequenceInfo")
+            SubElement(seq_info, "md:Number").text = title.sequence_number
 
-        if parent_id:
+        if title.parent_id:
             relationship = "isseasonof"
             if work_type == "episode":
                 relationship = "isepisodeof"
-            parent = ET.SubElement(basic, "md:Parent", {"relationshipType": relationship})
-            ET.SubElement(parent, "md:ParentContentID").text = f"md:cid:org:{parent_id}"
+            parent = SubElement(basic, "md:Parent", {"relationshipType": relationship})
+            SubElement(parent, "md:ParentContentID").text = f"md:cid:org:{title.parent_id}"
 
-    credit = ET.SubElement(root, "mdmec:CompanyDisplayCredit")
-    ET.SubElement(credit, "md:DisplayString", {"language": "en-US"}).text = to_str(base.get("displaystring"))
+    credit = SubElement(root, "mdmec:CompanyDisplayCredit")
+    SubElement(credit, "md:DisplayString", {"language": "en-US"}).text = title.display_string
 
-    xml_str = ET.tostring(root, encoding="utf-8")
-    pretty_xml = minidom.parseString(xml_str).toprettyxml(indent="  ", encoding="utf-8").decode("utf-8")
+    return root
 
-    return highlight_invalid_xml(pretty_xml)
+def generate_mec_xml(data) -> MecXmlResult:
+    if isinstance(data, Title):
+        title = data
+    else:
+        with stage("normalize"):
+            title = build_title(data)
+    with stage("build_tree"):
+        root = emit_mec_tree(title)
+    with stage("serialize"):
+        return serialize_mec_tree(root)
 
 def is_valid_xml_structure(xml_string: str) -> bool:
     try:
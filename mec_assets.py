@@ -0,0 +1,133 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# ArtReference 파일을 로컬 에셋 폴더에서 찾아 실제 이미지 크기를 ArtReference resolution과 비교합니다.
+# JPEG/PNG 헤더만 읽으며(파일 전체를 읽지 않음), 결과는 (경로, mtime, 크기) 기준으로 프로세스 안에 캐시합니다.
+
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from generate_mec import Title, build_title
+
+ASSET_COLUMNS = ["contentid", "language", "purpose", "file", "expected", "actual", "rule", "message"]
+DEFAULT_WORKERS = 32
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# 크기 정보가 없는 SOF가 아닌 마커 (DHT, JPG, DAC)
+_NOT_SOF = (0xC4, 0xC8, 0xCC)
+
+
+def _jpeg_size(f):
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b"\xff":
+            byte = f.read(1)
+        while byte == b"\xff":
+            byte = f.read(1)
+        if not byte:
+            raise ValueError("JPEG 크기 정보(SOF)를 찾지 못했습니다.")
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            continue
+        if marker in (0xD9, 0xDA):
+            raise ValueError("JPEG 크기 정보(SOF)를 찾지 못했습니다.")
+        (length,) = struct.unpack(">H", f.read(2))
+        if 0xC0 <= marker <= 0xCF and marker not in _NOT_SOF:
+            height, width = struct.unpack(">xHH", f.read(5))
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def read_image_size(path):
+    with open(path, "rb") as f:
+        head = f.read(24)
+        if head.startswith(PNG_SIGNATURE) and head[12:16] == b"IHDR":
+            return struct.unpack(">II", head[16:24])
+        if head.startswith(b"\xff\xd8"):
+            return _jpeg_size(f)
+    raise ValueError("JPEG/PNG 파일이 아닙니다.")
+
+
+# (가로, 세로, 오류) — lru_cache는 예외를 캐시하지 않으므로 오류도 값으로 돌려줍니다.
+@lru_cache(maxsize=65536)
+def _cached_size(path, mtime_ns, size):
+    try:
+        width, height = read_image_size(path)
+    except (OSError, ValueError, struct.error) as e:
+        return None, None, str(e) or type(e).__name__
+    return width, height, ""
+
+
+def image_size(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _cached_size(path, st.st_mtime_ns, st.st_size)
+
+
+def resolve_asset(asset_root, filename):
+    root = os.path.abspath(asset_root)
+    path = os.path.abspath(os.path.join(root, filename))
+    if os.path.commonpath([root, path]) != root:
+        return None
+    return path
+
+
+def _issue(title, loc, art, rule, message, actual=""):
+    return dict(zip(ASSET_COLUMNS, (title.content_id, loc.language, art.purpose, art.file, art.resolution, actual, rule, message)))
+
+
+def _models(titles):
+    for item in titles:
+        if isinstance(item, Title):
+            yield item
+            continue
+        content_id, rows = item
+        if not content_id:
+            continue
+        try:
+            yield rows if isinstance(rows, Title) else build_title(rows)
+        except Exception:
+            # 생성 단계에서 같은 오류가 리포트에 남습니다.
+            continue
+
+
+# titles: Title 또는 (contentid, 행 목록 또는 Title) 묶음. 같은 파일은 한 번만 읽습니다.
+def check_assets(titles, asset_root, max_workers=DEFAULT_WORKERS):
+    models = list(_models(titles))
+    references = [(title, loc, art) for title in models for loc in title.localized for art in loc.art]
+    paths = {art.file: resolve_asset(asset_root, art.file) for _, _, art in references}
+
+    unique = sorted({p for p in paths.values() if p})
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        sizes = dict(zip(unique, executor.map(image_size, unique)))
+
+    issues = []
+    for title, loc, art in references:
+        path = paths[art.file]
+        if path is None:
+            issues.append(_issue(title, loc, art, "asset_path_invalid", "에셋 폴더 밖을 가리키는 경로입니다."))
+            continue
+        result = sizes[path]
+        if result is None:
+            issues.append(_issue(title, loc, art, "asset_missing", "파일이 없습니다."))
+            continue
+        width, height, error = result
+        if error:
+            issues.append(_issue(title, loc, art, "asset_unreadable", error))
+            continue
+        actual = f"{width}x{height}"
+        if actual != art.resolution:
+            issues.append(_issue(title, loc, art, "resolution_mismatch", "이미지 크기가 resolution과 다릅니다.", actual))
+    return issues
@@ -0,0 +1,210 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# 증분 납품: 이전 납품본의 타이틀별 의미 지문(fingerprint)과 새 카탈로그를 비교해
+# 추가/변경된 타이틀만 생성합니다.
+#
+# 지문은 XML 문자열이 아니라 Title 모델에서 계산하므로, 이전 XML은 mec_reader로 읽어 같은 모델로 만든 뒤 비교합니다.
+# 공백 차이, 언어/장르/등급/아트의 순서 차이는 무시하고 인물 순서(BillingBlockOrder)는 구분합니다.
+
+import csv
+import hashlib
+import io
+import json
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from generate_mec import Title, build_title
+from mec_reader import iter_mec_files, read_mec
+
+INDEX_FILE = "fingerprints.json"
+MANIFEST_FILE = "changes.csv"
+MANIFEST_COLUMNS = ["contentid", "change", "sections"]
+SECTIONS = ["basic", "localized", "art", "people", "ratings"]
+
+
+def _norm(value):
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return [_norm(v) for v in value]
+
+
+def _digest(value):
+    return hashlib.sha256(json.dumps(_norm(value), ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
+
+def fingerprint(title):
+    sections = {
+        "basic": [
+            title.work_type_key, title.release_year, title.release_date, title.alt_id, title.original_language,
+            title.org_id, title.sequence_number, title.parent_id, title.display_string,
+        ],
+        "localized": sorted(
+            [loc.language, loc.title, loc.summary190, loc.summary400, sorted(loc.genres)] for loc in title.localized
+        ),
+        "art": sorted([loc.language, art.purpose, art.file] for loc in title.localized for art in loc.art),
+        "people": sorted([p.job_function, str(p.billing_order), sorted(p.names)] for p in title.people),
+        "ratings": sorted(list(r) for r in title.ratings),
+    }
+    return {name: _digest(sections[name]) for name in SECTIONS}
+
+
+def changed_sections(previous, current):
+    return [name for name in SECTIONS if previous.get(name) != current.get(name)]
+
+
+# 워커마다 ZIP을 한 번만 열어 둡니다.
+_zip_files = {}
+
+
+def _open_source(source):
+    if isinstance(source, tuple):
+        zip_path, name = source
+        if zip_path not in _zip_files:
+            _zip_files[zip_path] = zipfile.ZipFile(zip_path)
+        return io.BytesIO(_zip_files[zip_path].read(name))
+    return source
+
+
+def _fingerprint_source(source):
+    label = "!".join(source) if isinstance(source, tuple) else source
+    try:
+        title = build_title(read_mec(_open_source(source)))
+    except Exception as e:
+        return label, None, None, f"{type(e).__name__}: {e}"
+    return label, title.content_id, fingerprint(title), ""
+
+
+def _index_sources(path):
+    if os.path.isdir(path):
+        return list(iter_mec_files([path]))
+    with zipfile.ZipFile(path) as zf:
+        return [(path, name) for name in zf.namelist() if name.lower().endswith(".xml")]
+
+
+def _stored_index(path):
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    if os.path.isdir(path):
+        index_path = os.path.join(path, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                return json.load(f)
+        return None
+    with zipfile.ZipFile(path) as zf:
+        if INDEX_FILE in zf.namelist():
+            return json.loads(zf.read(INDEX_FILE))
+    return None
+
+
+def _fingerprint_all(sources, max_workers=None):
+    if max_workers == 1 or len(sources) < 2:
+        yield from map(_fingerprint_source, sources)
+        return
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, min(256, len(sources) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_fingerprint_source, sources, chunksize=chunksize)
+
+
+# 이전 납품본(디렉터리/ZIP의 MEC XML, 또는 이전 증분 실행이 남긴 fingerprints.json)을 contentid → 지문 dict로 읽습니다.
+# 저장된 지문이 있으면 XML을 다시 읽지 않습니다. (인덱스, 읽지 못한 파일 목록)을 돌려줍니다.
+def load_index(path, max_workers=None):
+    stored = _stored_index(path)
+    if stored is not None:
+        return stored, []
+
+    index = {}
+    failed = []
+    for label, content_id, fp, error in _fingerprint_all(_index_sources(path), max_workers):
+        if error:
+            failed.append((label, error))
+        else:
+            index[content_id] = fp
+    return index, failed
+
+
+# generate_stream에 넘기는 sink를 감싸 변경된 타이틀만 생성되도록 걸러내고,
+# 닫을 때 변경 목록(changes.csv)과 다음 증분 실행용 지문(fingerprints.json)을 함께 기록합니다.
+# complete=False(contentid/worktype 필터를 쓴 실행)면 보이지 않은 타이틀을 삭제로 보지 않고 이전 지문을 유지합니다.
+class DeltaSink:
+    def __init__(self, sink, previous, complete=True):
+        self.sink = sink
+        self.previous = previous
+        self.complete = complete
+        self.changes = []
+        self.fingerprints = {}
+        self.pending = {}
+        self.seen = set()
+        self.unchanged = 0
+
+    def select(self, titles):
+        for content_id, rows in titles:
+            if not content_id:
+                yield content_id, rows
+                continue
+            self.seen.add(content_id)
+            try:
+                title = rows if isinstance(rows, Title) else build_title(rows)
+            except Exception:
+                # 생성 단계에서 같은 오류를 리포트에 남깁니다.
+                yield content_id, rows
+                continue
+            current = fingerprint(title)
+            previous = self.previous.get(content_id)
+            if previous == current:
+                self.fingerprints[content_id] = current
+                self.unchanged += 1
+                continue
+            if previous is None:
+                self.changes.append({"contentid": content_id, "change": "added", "sections": ""})
+            else:
+                sections = ";".join(changed_sections(previous, current))
+                self.changes.append({"contentid": content_id, "change": "changed", "sections": sections})
+            self.pending[content_id] = current
+            yield content_id, title
+
+    def add(self, result):
+        self.sink.add(result)
+
+    def write_file(self, name, data):
+        self.sink.write_file(name, data)
+
+    def close(self, report):
+        failed = {r["contentid"] for r in report if r["status"] == "error"}
+        for content_id, current in self.pending.items():
+            if content_id not in failed:
+                self.fingerprints[content_id] = current
+            elif content_id in self.previous:
+                # 실패한 타이틀은 이전 지문을 남겨 다음 실행에서 다시 생성되게 합니다.
+                self.fingerprints[content_id] = self.previous[content_id]
+
+        for content_id in self.previous.keys() - self.seen:
+            if self.complete:
+                self.changes.append({"contentid": content_id, "change": "removed", "sections": ""})
+            else:
+                self.fingerprints[content_id] = self.previous[content_id]
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=MANIFEST_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(self.changes)
+        self.sink.write_file(MANIFEST_FILE, buffer.getvalue())
+        self.sink.write_file(INDEX_FILE, json.dumps(self.fingerprints, ensure_ascii=False, sort_keys=True))
+        self.sink.close(report)
+
+    def summary(self):
+        counts = {"added": 0, "changed": 0, "removed": 0}
+        for change in self.changes:
+            counts[change["change"]] += 1
+        counts["unchanged"] = self.unchanged
+        return counts
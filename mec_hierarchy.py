@@ -0,0 +1,149 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# 시리즈 → 시즌 → 에피소드 계층 인덱스와 무결성 검사.
+# contentid → Title, 부모 contentid → 자식 contentid 목록 두 개의 dict만 만들고
+# 모든 검사는 타이틀을 한 번씩만 훑습니다.
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from generate_mec import Title, build_title
+
+ISSUE_COLUMNS = ["contentid", "worktype", "level", "rule", "value", "message"]
+
+# 자식 worktype → 허용되는 부모 worktype
+PARENT_TYPES = {
+    "season": ("series",),
+    "episode": ("season", "series"),
+}
+ORDER = {"series": 0, "season": 1, "episode": 2}
+
+
+@dataclass
+class Hierarchy:
+    titles: dict = field(default_factory=dict)
+    children: dict = field(default_factory=lambda: defaultdict(list))
+
+    def add(self, title):
+        self.titles[title.content_id] = title
+        if title.work_type_key in PARENT_TYPES and title.parent_id:
+            self.children[title.parent_id].append(title.content_id)
+
+    # 시리즈 다음에 시즌(번호순), 각 시즌 다음에 그 에피소드(번호순)가 오도록 정렬합니다.
+    # 부모가 없거나 찾을 수 없는 타이틀은 각자 최상위로 취급합니다.
+    def ordered(self):
+        roots = [
+            cid for cid, t in self.titles.items()
+            if t.work_type_key not in PARENT_TYPES or t.parent_id not in self.titles
+        ]
+        roots.sort(key=lambda cid: ORDER.get(self.titles[cid].work_type_key, 0))
+        visited = set()
+        stack = list(reversed(roots))
+        while stack:
+            cid = stack.pop()
+            if cid in visited:
+                continue
+            visited.add(cid)
+            yield cid, self.titles[cid]
+            stack.extend(reversed(sorted(self.children.get(cid, ()), key=self._sequence_key)))
+        # 순환 참조로 최상위에서 닿지 않는 타이틀
+        for cid, title in self.titles.items():
+            if cid not in visited:
+                yield cid, title
+
+    def _sequence_key(self, cid):
+        title = self.titles[cid]
+        number = title.sequence_number
+        return ORDER.get(title.work_type_key, 0), not number.isdigit(), int(number) if number.isdigit() else 0, cid
+
+
+def build_hierarchy(titles):
+    hierarchy = Hierarchy()
+    for content_id, title in titles:
+        hierarchy.add(title if isinstance(title, Title) else build_title(title))
+    return hierarchy
+
+
+def _issue(title, level, rule, value, message):
+    return dict(zip(ISSUE_COLUMNS, (title.content_id, title.work_type, level, rule, value, message)))
+
+
+# 있는 번호만 정렬해 이웃 사이의 빈 구간을 찾습니다. 번호 크기가 아니라 타이틀 수에 비례합니다.
+# (20240101 같은 날짜형 번호도 안전) 구간이 많으면 앞쪽 MAX_GAP_RANGES개만 적고 나머지는 개수로 요약합니다.
+MAX_GAP_RANGES = 10
+
+
+def _gaps(present):
+    gaps = []
+    prev = 0
+    for n in sorted(present):
+        if n > prev + 1:
+            gaps.append((prev + 1, n - 1))
+        prev = n
+    return gaps
+
+
+def _ranges(gaps):
+    parts = [str(start) if start == end else f"{start}-{end}" for start, end in gaps[:MAX_GAP_RANGES]]
+    if len(gaps) > MAX_GAP_RANGES:
+        parts.append(f"외 {len(gaps) - MAX_GAP_RANGES}구간")
+    return ", ".join(parts)
+
+
+def check_hierarchy(hierarchy):
+    titles = hierarchy.titles
+    issues = []
+
+    for title in titles.values():
+        kind = title.work_type_key
+        if kind not in PARENT_TYPES:
+            continue
+        allowed = PARENT_TYPES[kind]
+        parent = titles.get(title.parent_id)
+        if not title.parent_id:
+            issues.append(_issue(title, "error", "parent_missing", "", "parentcontentid 누락"))
+        elif parent is None:
+            issues.append(_issue(title, "error", "parent_not_found", title.parent_id,
+                                 "부모 타이틀이 카탈로그에 없습니다."))
+        elif parent.work_type_key not in allowed:
+            issues.append(_issue(title, "error", "parent_type", title.parent_id,
+                                 f"{kind}의 부모는 {'/'.join(allowed)}이어야 합니다. (현재: {parent.work_type})"))
+        if not title.sequence_number:
+            issues.append(_issue(title, "warning", "sequence_missing", "", "sequencenumber 누락"))
+        elif not title.sequence_number.isdigit():
+            issues.append(_issue(title, "error", "sequence_invalid", title.sequence_number,
+                                 "sequencenumber는 양의 정수여야 합니다."))
+
+    # 같은 부모 아래 같은 worktype끼리 번호 중복/누락 검사
+    for parent_id, child_ids in hierarchy.children.items():
+        parent = titles.get(parent_id)
+        if parent is None:
+            continue
+        seen = {}
+        for cid in child_ids:
+            child = titles[cid]
+            if not child.sequence_number.isdigit():
+                continue
+            key = (child.work_type_key, int(child.sequence_number))
+            if key in seen:
+                issues.append(_issue(child, "error", "sequence_duplicate", child.sequence_number,
+                                     f"{parent_id} 안에서 {seen[key]}와 번호가 중복됩니다."))
+            else:
+                seen[key] = cid
+        numbers = defaultdict(set)
+        for kind, number in seen:
+            numbers[kind].add(number)
+        for kind, present in numbers.items():
+            gaps = _gaps(present)
+            if gaps:
+                issues.append(_issue(parent, "warning", "sequence_gap", _ranges(gaps),
+                                     f"하위 {kind} 번호가 연속되지 않습니다."))
+    return issues
@@ -0,0 +1,268 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# 카탈로그를 행 레코드(소문자 컬럼명 → 값 dict)로 읽습니다.
+# CSV는 표준 라이브러리 csv 모듈로 읽으므로 CLI/워커 프로세스가 pandas 없이 빠르게 시작됩니다.
+# Parquet/Feather(pyarrow)와 Excel(openpyxl)은 선택 의존성이며 해당 형식을 읽을 때만 import합니다.
+
+import csv
+import io
+import os
+from contextlib import contextmanager
+
+from generate_mec import ART_TAGS, PEOPLE_COLUMN, to_str
+
+# 생성기가 사용하는 컬럼. 이 외의 컬럼은 읽지 않습니다. (genre*, director*/writer*/actor*는 접두어로 판별)
+CATALOG_COLUMNS = {
+    "contentid", "language", "title", "worktype", "summary190", "summary400", *ART_TAGS,
+    "releaseyear", "releasedate", "altid_org", "ratinginfo", "originallanguage", "orgid",
+    "displaystring", "sequencenumber", "parentcontentid",
+}
+
+FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".xlsx": "excel",
+    ".xlsm": "excel",
+}
+
+
+def is_catalog_column(name):
+    return name in CATALOG_COLUMNS or name.startswith("genre") or bool(PEOPLE_COLUMN.match(name))
+
+
+def catalog_format(filename):
+    ext = os.path.splitext(str(filename))[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {ext or filename}")
+    return FORMATS[ext]
+
+
+@contextmanager
+def _text_stream(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="", encoding="utf-8-sig") as f:
+            yield f
+    elif isinstance(source, io.TextIOBase):
+        yield source
+    else:
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        wrapper = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+        try:
+            yield wrapper
+        finally:
+            wrapper.detach()
+
+
+# 같은 이름의 컬럼이 여러 번 나오면 pandas처럼 두 번째부터 "genre.1", "genre.2"로 이름을 바꿔 모두 남깁니다.
+def dedupe_header(header):
+    seen = set()
+    names = []
+    for name in header:
+        unique, n = name, 0
+        while unique in seen:
+            n += 1
+            unique = f"{name}.{n}"
+        seen.add(unique)
+        names.append(unique)
+    return names
+
+
+def iter_csv_records(source, project=False):
+    with _text_stream(source) as f:
+        reader = csv.reader(f)
+        header = dedupe_header([h.lower() for h in next(reader, [])])
+        width = len(header)
+        keep = [(i, name) for i, name in enumerate(header) if not project or is_catalog_column(name)]
+        for values in reader:
+            if not any(values):
+                continue
+            if len(values) < width:
+                values += [""] * (width - len(values))
+            yield {name: values[i] for i, name in keep}
+
+
+def read_csv_records(source):
+    return list(iter_csv_records(source))
+
+
+def content_id_of(row):
+    return to_str(row.get("contentid")).strip()
+
+
+def _check_content_id(row):
+    if "contentid" not in row:
+        raise ValueError("'contentid' 컬럼이 없습니다.")
+
+
+# contentid별로 묶되 처음 등장한 순서를 유지합니다. (연속되지 않은 행도 같은 타이틀로 모음)
+def group_titles(records):
+    titles = {}
+    for row in records:
+        if not titles:
+            _check_content_id(row)
+        titles.setdefault(content_id_of(row), []).append(row)
+    return iter(titles.items())
+
+
+# contentid가 연속된 행 묶음을 타이틀 하나로 내보냅니다.
+# 현재 타이틀의 행만 들고 있으므로 메모리는 파일 크기가 아니라 가장 큰 타이틀 하나로 제한됩니다.
+def iter_titles(records):
+    pending_id, pending = None, []
+    for row in records:
+        content_id = content_id_of(row)
+        if pending and content_id == pending_id:
+            pending.append(row)
+            continue
+        if pending:
+            yield pending_id, pending
+        else:
+            _check_content_id(row)
+        pending_id, pending = content_id, [row]
+    if pending:
+        yield pending_id, pending
+
+
+def filter_records(records, contentids=None, worktypes=None):
+    ids = {c.strip() for c in contentids} if contentids else None
+    kinds = {w.strip().lower() for w in worktypes} if worktypes else None
+    for row in records:
+        if ids is not None and content_id_of(row) not in ids:
+            continue
+        if kinds is not None and to_str(row.get("worktype")).strip().lower() not in kinds:
+            continue
+        yield row
+
+
+def _missing_column(names, worktypes):
+    if "contentid" not in names:
+        return "contentid"
+    if worktypes and "worktype" not in names:
+        return "worktype"
+    return ""
+
+
+def _require_columns(names, worktypes):
+    missing = _missing_column(names, worktypes)
+    if missing:
+        raise ValueError(f"'{missing}' 컬럼이 없습니다.")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Parquet/Feather 파일을 읽으려면 pyarrow가 필요합니다: pip install pyarrow") from e
+    return pyarrow
+
+
+# contentid 필터는 Parquet row group 통계로 건너뛸 수 있도록 스캔 단계에 넘깁니다.
+def _arrow_filter(schema, names, contentids, worktypes):
+    pa = _import_pyarrow()
+    import pyarrow.compute as pc
+
+    expr = None
+    if contentids:
+        field = pc.field(names["contentid"])
+        column_type = schema.field(names["contentid"]).type
+        if not (pa.types.is_string(column_type) or pa.types.is_large_string(column_type)):
+            field = field.cast(pa.string())
+        expr = field.isin([c.strip() for c in contentids])
+    if worktypes:
+        kinds = pc.utf8_lower(pc.utf8_trim_whitespace(pc.field(names["worktype"])))
+        condition = kinds.isin([w.strip().lower() for w in worktypes])
+        expr = condition if expr is None else expr & condition
+    return expr
+
+
+def _read_arrow(source, fmt, contentids=None, worktypes=None):
+    pa = _import_pyarrow()
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(source)
+    else:
+        import pyarrow.feather as feather
+
+        schema = pa.ipc.open_file(source).schema
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+    names = {name.lower(): name for name in schema.names}
+    _require_columns(names, worktypes)
+    columns = [name for lower, name in names.items() if is_catalog_column(lower)]
+    expr = _arrow_filter(schema, names, contentids, worktypes)
+
+    if fmt == "parquet":
+        table = pq.read_table(source, columns=columns, filters=expr)
+    else:
+        table = feather.read_table(source, columns=columns)
+        if expr is not None:
+            table = table.filter(expr)
+    table = table.rename_columns([name.lower() for name in table.column_names])
+    return table.to_pylist()
+
+
+def _read_excel(source, sheets=None, contentids=None, worktypes=None):
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:
+        raise ImportError("Excel 파일을 읽으려면 openpyxl이 필요합니다: pip install openpyxl") from e
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    records = []
+    read = 0
+    try:
+        unknown = [name for name in sheets or () if name not in workbook.sheetnames]
+        if unknown:
+            raise ValueError(f"시트가 없습니다: {', '.join(unknown)} (있는 시트: {', '.join(workbook.sheetnames)})")
+        worksheets = [workbook[name] for name in sheets] if sheets else workbook.worksheets
+        for sheet in worksheets:
+            rows = sheet.iter_rows(values_only=True)
+            header = dedupe_header([str(h).strip().lower() if h is not None else "" for h in next(rows, ())])
+            keep = [(i, name) for i, name in enumerate(header) if is_catalog_column(name)]
+            # 시트를 지정하지 않았으면 필수 컬럼이 없는 시트(메모, 코드표 등)는 건너뜁니다.
+            missing = _missing_column(header, worktypes)
+            if missing:
+                if sheets:
+                    raise ValueError(f"'{sheet.title}' 시트에 '{missing}' 컬럼이 없습니다.")
+                continue
+            read += 1
+            width = keep[-1][0] + 1
+            for values in rows:
+                values = tuple(values[:width]) + (None,) * (width - len(values))
+                if all(v is None for v in values):
+                    continue
+                records.append({name: values[i] for i, name in keep})
+    finally:
+        workbook.close()
+    if not read:
+        required = "contentid, worktype" if worktypes else "contentid"
+        raise ValueError(f"필수 컬럼({required})이 있는 시트가 없습니다.")
+    return list(filter_records(records, contentids, worktypes))
+
+
+# 파일 형식에 맞는 어댑터로 생성기가 쓰는 컬럼만 읽고, contentid/worktype 필터를 적용합니다.
+# source는 경로 또는 파일 객체이며, 파일 객체면 fmt(또는 파일명)를 함께 넘겨야 합니다.
+def read_catalog(source, fmt=None, contentids=None, worktypes=None, sheets=None):
+    fmt = fmt or catalog_format(source)
+    if fmt == "csv":
+        records = iter_csv_records(source, project=True)
+        return list(filter_records(records, contentids, worktypes))
+    if fmt in ("parquet", "feather"):
+        return _read_arrow(source, fmt, contentids, worktypes)
+    if fmt == "excel":
+        return _read_excel(source, sheets, contentids, worktypes)
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {fmt}")
@@ -0,0 +1,170 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# 업로드 → 검증 → 생성 → 직렬화 → 체크 단계별 소요 시간/메모리 계측.
+# 꺼져 있으면 stage()는 공유된 no-op 컨텍스트를 돌려주므로 비용이 거의 없습니다.
+# 환경 변수 MEC_METRICS=1 (메모리 계측까지: MEC_METRICS=memory) 또는 enable()로 켭니다.
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+logger = logging.getLogger("mec.metrics")
+
+WINDOW = 1024
+
+_lock = threading.Lock()
+_samples = {}
+_counts = {}
+_totals = {}
+_memory = {}
+
+ENABLED = False
+_owns_tracemalloc = False
+
+
+class _NoOpStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoOpStage()
+
+
+class _Stage:
+    __slots__ = ("name", "start", "memory")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        delta = None
+        if self.memory is not None and tracemalloc.is_tracing():
+            delta = tracemalloc.get_traced_memory()[0] - self.memory
+        record(self.name, seconds, delta)
+        return False
+
+
+def stage(name):
+    if not ENABLED:
+        return _NOOP
+    return _Stage(name)
+
+
+def enable(memory=False):
+    global ENABLED, _owns_tracemalloc
+    ENABLED = True
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _owns_tracemalloc = True
+    elif not memory and _owns_tracemalloc:
+        tracemalloc.stop()
+        _owns_tracemalloc = False
+
+
+def disable():
+    global ENABLED, _owns_tracemalloc
+    ENABLED = False
+    if _owns_tracemalloc:
+        tracemalloc.stop()
+        _owns_tracemalloc = False
+
+
+def record(name, seconds, memory_delta=None):
+    with _lock:
+        if name not in _samples:
+            _samples[name] = deque(maxlen=WINDOW)
+            _counts[name] = 0
+            _totals[name] = 0.0
+        _samples[name].append(seconds)
+        _counts[name] += 1
+        _totals[name] += seconds
+        if memory_delta is not None:
+            _memory[name] = memory_delta
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({
+            "event": "stage",
+            "stage": name,
+            "seconds": round(seconds, 6),
+            "memory_delta_bytes": memory_delta,
+        }))
+
+
+def reset():
+    with _lock:
+        _samples.clear()
+        _counts.clear()
+        _totals.clear()
+        _memory.clear()
+
+
+def _quantile(sorted_values, q):
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def snapshot():
+    with _lock:
+        stages = {name: sorted(values) for name, values in _samples.items()}
+        counts = dict(_counts)
+        totals = dict(_totals)
+        memory = dict(_memory)
+    return [
+        {
+            "stage": name,
+            "count": counts[name],
+            "total_seconds": totals[name],
+            "p50_seconds": _quantile(values, 0.5),
+            "p95_seconds": _quantile(values, 0.95),
+            "last_memory_delta_bytes": memory.get(name),
+        }
+        for name, values in stages.items()
+    ]
+
+
+def prometheus_text():
+    lines = [
+        "# HELP mec_stage_duration_seconds MEC pipeline stage duration (quantiles over the last %d samples)." % WINDOW,
+        "# TYPE mec_stage_duration_seconds summary",
+    ]
+    rows = snapshot()
+    for row in rows:
+        label = f'stage="{row["stage"]}"'
+        lines.append(f'mec_stage_duration_seconds{{{label},quantile="0.5"}} {row["p50_seconds"]:.6f}')
+        lines.append(f'mec_stage_duration_seconds{{{label},quantile="0.95"}} {row["p95_seconds"]:.6f}')
+        lines.append(f"mec_stage_duration_seconds_sum{{{label}}} {row['total_seconds']:.6f}")
+        lines.append(f"mec_stage_duration_seconds_count{{{label}}} {row['count']}")
+    memory_rows = [row for row in rows if row["last_memory_delta_bytes"] is not None]
+    if memory_rows:
+        lines.append("# HELP mec_stage_memory_delta_bytes Traced memory delta of the most recent run of each stage.")
+        lines.append("# TYPE mec_stage_memory_delta_bytes gauge")
+        for row in memory_rows:
+            lines.append(f'mec_stage_memory_delta_bytes{{stage="{row["stage"]}"}} {row["last_memory_delta_bytes"]}')
+    return "\n".join(lines) + "\n"
+
+
+_env = os.environ.get("MEC_METRICS", "").strip().lower()
+if _env and _env != "0":
+    enable(memory=_env == "memory")
@@ -0,0 +1,238 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# 납품된 MEC XML을 생성기 입력과 같은 CSV 컬럼 구조(언어별 행, genreN, actorN, ratinginfo, 아트 컬럼)로
+# 되돌립니다. iterparse로 읽으면서 처리한 LocalizedInfo/People/Rating 요소를 바로 비워 메모리를 일정하게 유지합니다.
+#
+# 사용법: python mec_reader.py archive/ -o catalog.csv -j 8
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+from generate_mec import ART_TAGS, JOB_FUNCTIONS, PEOPLE_COLUMN
+
+# md/mdmec 버전(v2.4, v2.6 ...)과 상관없이 MovieLabs 네임스페이스의 요소를 로컬 이름으로 찾습니다.
+MOVIELABS_NS = "http://www.movielabs.com/schema/"
+CID_PREFIX = "md:cid:org:"
+
+LEADING_COLUMNS = ["contentid", "language", "title", "worktype", "summary190", "summary400", *ART_TAGS]
+TRAILING_COLUMNS = [
+    "releaseyear", "releasedate", "altid_org", "ratinginfo", "originallanguage", "orgid",
+    "displaystring", "sequencenumber", "parentcontentid",
+]
+
+# 단순 텍스트 값: 태그 → 컬럼
+_BASIC_FIELDS = {
+    "ReleaseYear": "releaseyear",
+    "ReleaseDate": "releasedate",
+    "WorkType": "worktype",
+    "OriginalLanguage": "originallanguage",
+    "Number": "sequencenumber",
+}
+
+
+def _text(elem):
+    return (elem.text or "").strip() if elem is not None else ""
+
+
+# '{http://www.movielabs.com/schema/md/v2.4/md}People' → ('{...md/v2.4/md}', 'People'). 다른 네임스페이스는 ('', '')
+def _split_tag(tag):
+    if not isinstance(tag, str) or not tag.startswith("{" + MOVIELABS_NS):
+        return "", ""
+    ns, _, name = tag.rpartition("}")
+    return ns + "}", name
+
+
+def _strip_cid(value):
+    value = (value or "").strip()
+    return value[len(CID_PREFIX):] if value.startswith(CID_PREFIX) else value
+
+
+def read_mec(source):
+    base = {}
+    localized = []
+    people = []
+    ratings = []
+
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        md, tag = _split_tag(elem.tag)
+        if event == "start":
+            if tag == "Basic":
+                base["contentid"] = _strip_cid(elem.get("ContentID"))
+            continue
+
+        if tag == "LocalizedInfo":
+            row = {
+                "language": elem.get("language", ""),
+                "title": _text(elem.find(md + "TitleDisplayUnlimited")),
+                "summary190": _text(elem.find(md + "Summary190")),
+                "summary400": _text(elem.find(md + "Summary400")),
+            }
+            for art in elem.iterfind(md + "ArtReference"):
+                if art.get("purpose") in ART_TAGS:
+                    row[art.get("purpose")] = _text(art)
+            for i, genre in enumerate(elem.iterfind(md + "Genre"), start=1):
+                row[f"genre{i}"] = genre.get("id", "")
+            localized.append(row)
+            elem.clear()
+        elif tag == "People":
+            job = _text(elem.find(f"{md}Job/{md}JobFunction"))
+            order = _text(elem.find(f"{md}Job/{md}BillingBlockOrder"))
+            names = {d.get("language", ""): _text(d) for d in elem.iterfind(f"{md}Name/{md}DisplayName")}
+            people.append((job, order, names))
+            elem.clear()
+        elif tag == "Rating":
+            parts = [
+                _text(elem.find(f"{md}Region/{md}country")),
+                _text(elem.find(md + "System")),
+                _text(elem.find(md + "Value")),
+            ]
+            ratings.append(":".join(parts))
+            elem.clear()
+        elif tag in _BASIC_FIELDS:
+            base[_BASIC_FIELDS[tag]] = _text(elem)
+        elif tag == "AltIdentifier":
+            if _text(elem.find(md + "Namespace")) == "ORG":
+                base["altid_org"] = _text(elem.find(md + "Identifier"))
+        elif tag == "AssociatedOrg":
+            base.setdefault("orgid", elem.get("organizationID", ""))
+        elif tag == "ParentContentID":
+            base["parentcontentid"] = _strip_cid(elem.text)
+        elif tag == "CompanyDisplayCredit":
+            # DisplayString은 md 네임스페이스, CompanyDisplayCredit은 mdmec 네임스페이스입니다.
+            display = next((d for d in elem if _split_tag(d.tag)[1] == "DisplayString"), None)
+            base["displaystring"] = _text(display)
+            elem.clear()
+
+    # MEC가 아닌 XML이나 LocalizedInfo가 없는 문서는 빈 CSV 대신 실패로 보고합니다.
+    if "contentid" not in base:
+        raise ValueError("MEC Basic 요소가 없습니다.")
+    if not localized:
+        raise ValueError("LocalizedInfo 요소가 없습니다.")
+
+    base["ratinginfo"] = ";".join(ratings)
+
+    # 역할별 BillingBlockOrder를 컬럼 번호로 사용 (director1, actor3 ...)
+    counters = {}
+    people_columns = []
+    for job, order, names in people:
+        job = job.lower()
+        if job.capitalize() not in JOB_FUNCTIONS:
+            continue
+        counters[job] = counters.get(job, 0) + 1
+        number = order if order.isdigit() else str(counters[job])
+        people_columns.append((f"{job}{number}", names))
+
+    rows = []
+    for loc in localized:
+        row = {"contentid": base.get("contentid", ""), "worktype": base.get("worktype", ""), **loc}
+        for column, names in people_columns:
+            row[column] = names.get(loc["language"], "")
+        for column in TRAILING_COLUMNS:
+            row[column] = base.get(column, "")
+        rows.append(row)
+    return rows
+
+
+def _column_key(column):
+    if column in LEADING_COLUMNS:
+        return 0, LEADING_COLUMNS.index(column), 0, column
+    if column.startswith("genre") and column[5:].isdigit():
+        return 1, 0, int(column[5:]), column
+    match = PEOPLE_COLUMN.match(column)
+    if match:
+        return 2, JOB_FUNCTIONS.index(match.group(1).capitalize()), int(match.group(2) or 0), column
+    if column in TRAILING_COLUMNS:
+        return 3, TRAILING_COLUMNS.index(column), 0, column
+    return 4, 0, 0, column
+
+
+def order_columns(columns):
+    return sorted(columns, key=_column_key)
+
+
+def iter_mec_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    if name.lower().endswith(".xml"):
+                        yield os.path.join(dirpath, name)
+        else:
+            yield path
+
+
+def _read_file(path):
+    try:
+        return path, read_mec(path), ""
+    except (ET.ParseError, OSError, ValueError) as e:
+        return path, [], f"{type(e).__name__}: {e}"
+
+
+# (경로, 행 목록, 오류)를 입력 순서대로 내보냅니다.
+def read_mec_files(paths, max_workers=None):
+    files = list(iter_mec_files(paths))
+    if max_workers == 1 or len(files) < 2:
+        yield from map(_read_file, files)
+        return
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, min(64, len(files) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_read_file, files, chunksize=chunksize)
+
+
+# 문서마다 컬럼 구성이 다르므로(장르/배우 수) 행은 임시 파일에 먼저 쓰고
+# 전체 컬럼을 안 뒤에 CSV 헤더와 함께 다시 씁니다.
+def write_csv(results, target):
+    columns = {}
+    failed = []
+    count = 0
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+        for path, rows, error in results:
+            if error:
+                failed.append((path, error))
+                continue
+            count += 1
+            for row in rows:
+                columns.update(dict.fromkeys(row))
+                spool.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+        spool.seek(0)
+        with open(target, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=order_columns(columns), restval="")
+            writer.writeheader()
+            for line in spool:
+                writer.writerow(json.loads(line))
+    return count, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MEC XML 파일을 생성기 입력 CSV 형식으로 변환합니다.")
+    parser.add_argument("inputs", nargs="+", help="MEC XML 파일 또는 디렉터리")
+    parser.add_argument("-o", "--output", required=True, help="출력 CSV 경로")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 수)")
+    args = parser.parse_args(argv)
+
+    count, failed = write_csv(read_mec_files(args.inputs, args.workers), args.output)
+    print(f"{count}/{count + len(failed)} files converted -> {args.output}")
+    for path, error in failed:
+        print(f"  {path}: {error}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# MEC v2.6 XSD 검증. lxml(선택 의존성)로 schemas/ 폴더의 XSD를 프로세스당 한 번만 컴파일해 재사용합니다.
+# XSD 안의 import/include URL은 네트워크 대신 같은 폴더의 같은 파일명으로 연결합니다.
+# 오류는 XPath를 Title 모델에 대응시켜 CSV 행(contentid + language)과 컬럼으로 돌려줍니다.
+#
+# XSD 받기: python mec_schema.py --fetch  (MovieLabs에서 mdmec-v2.6.xsd와 import되는 XSD를 schemas/에 저장)
+
+import argparse
+import os
+import re
+import sys
+import threading
+import urllib.request
+import xml.etree.ElementTree as ET
+from urllib.parse import urljoin, urlparse
+
+from generate_mec import Title, build_title
+from mec_structure import NAMESPACES
+
+SCHEMA_DIR = os.environ.get("MEC_SCHEMA_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "schemas")
+MAIN_SCHEMA = "mdmec-v2.6.xsd"
+SCHEMA_URL = os.environ.get("MEC_SCHEMA_URL") or "https://www.movielabs.com/md/mec/v2.6/mdmec-v2.6.xsd"
+XS = "{http://www.w3.org/2001/XMLSchema}"
+SCHEMA_COLUMNS = ["contentid", "language", "column", "line", "path", "message"]
+
+LOCALIZED_COLUMNS = {
+    "TitleDisplayUnlimited": "title",
+    "Summary190": "summary190",
+    "Summary400": "summary400",
+}
+BASIC_COLUMNS = {
+    "ReleaseYear": "releaseyear",
+    "ReleaseDate": "releasedate",
+    "WorkType": "worktype",
+    "AltIdentifier": "altid_org",
+    "RatingSet": "ratinginfo",
+    "OriginalLanguage": "originallanguage",
+    "AssociatedOrg": "orgid",
+    "SequenceInfo": "sequencenumber",
+    "Parent": "parentcontentid",
+}
+_STEP = re.compile(r"^(?:[\w.-]+:)?([\w.-]+)(?:\[(\d+)\])?$")
+
+_lock = threading.Lock()
+_schemas = {}
+
+
+def _import_lxml():
+    try:
+        from lxml import etree
+    except ImportError as e:
+        raise ImportError("XSD 검증에는 lxml이 필요합니다: pip install lxml") from e
+    return etree
+
+
+# 같은 프로세스에서는 컴파일된 스키마를 공유합니다. (배치 워커는 프로세스마다 한 번 컴파일)
+def get_schema(schema_dir=None):
+    schema_dir = os.path.abspath(schema_dir or SCHEMA_DIR)
+    with _lock:
+        if schema_dir not in _schemas:
+            _schemas[schema_dir] = _compile(schema_dir)
+        return _schemas[schema_dir]
+
+
+def _compile(schema_dir):
+    etree = _import_lxml()
+    main_path = os.path.join(schema_dir, MAIN_SCHEMA)
+    if not os.path.exists(main_path):
+        raise FileNotFoundError(f"MEC XSD가 없습니다: {main_path} (python mec_schema.py --fetch 로 받으세요)")
+
+    class LocalResolver(etree.Resolver):
+        def resolve(self, url, pubid, context):
+            path = os.path.join(schema_dir, os.path.basename(urlparse(url).path))
+            if os.path.exists(path):
+                return self.resolve_filename(path, context)
+            return None
+
+    parser = etree.XMLParser(no_network=True)
+    parser.resolvers.add(LocalResolver())
+    try:
+        return etree.XMLSchema(etree.parse(main_path, parser))
+    except (etree.XMLSyntaxError, etree.XMLSchemaParseError) as e:
+        raise ValueError(f"MEC XSD를 컴파일하지 못했습니다: {e}") from e
+
+
+# MAIN_SCHEMA와 import/include로 연결된 XSD를 모두 받아 schema_dir에 파일명 그대로 저장합니다.
+# (LocalResolver가 같은 파일명으로 연결하므로 XSD 안의 URL은 고치지 않습니다)
+def fetch_schemas(schema_dir=None, url=SCHEMA_URL, timeout=30):
+    schema_dir = os.path.abspath(schema_dir or SCHEMA_DIR)
+    os.makedirs(schema_dir, exist_ok=True)
+    pending = [(url, MAIN_SCHEMA)]
+    saved = []
+    while pending:
+        url, name = pending.pop()
+        if name in saved:
+            continue
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            data = response.read()
+        with open(os.path.join(schema_dir, name), "wb") as f:
+            f.write(data)
+        saved.append(name)
+        for elem in ET.fromstring(data).iter():
+            location = elem.get("schemaLocation") if elem.tag in (XS + "import", XS + "include") else None
+            if location:
+                pending.append((urljoin(url, location), os.path.basename(urlparse(location).path)))
+    with _lock:
+        _schemas.pop(schema_dir, None)
+    return saved
+
+
+# 스키마를 쓸 수 없는 이유 (쓸 수 있으면 ""). 실패는 캐시하지 않으므로 XSD를 나중에 넣어도 다시 확인합니다.
+def schema_error(schema_dir=None):
+    try:
+        get_schema(schema_dir)
+    except (ImportError, OSError, ValueError) as e:
+        return str(e)
+    return ""
+
+
+def schema_available(schema_dir=None):
+    return not schema_error(schema_dir)
+
+
+# '{http://www.movielabs.com/schema/md/v2.6/md}Summary190' → 'md:Summary190'
+def _short_message(message):
+    for prefix, uri in NAMESPACES.items():
+        message = message.replace(f"{{{uri}}}", f"{prefix}:")
+    return message
+
+
+def _steps(path):
+    steps = []
+    for part in (path or "").strip("/").split("/"):
+        match = _STEP.match(part)
+        if match:
+            steps.append((match.group(1), int(match.group(2) or 1)))
+    return steps
+
+
+# XPath(예: /mdmec:CoreMetadata/mdmec:Basic/md:LocalizedInfo[2]/md:ArtReference[3])를 (language, CSV 컬럼)으로 바꿉니다.
+# genre/인물 컬럼은 해당 LocalizedInfo/People 안의 순번으로 표시합니다. (genre2 = 두 번째로 채워진 장르)
+def locate(title, path):
+    steps = _steps(path)
+    names = [name for name, _ in steps]
+    if "CompanyDisplayCredit" in names:
+        return "", "displaystring"
+    if "Basic" not in names:
+        return "", ""
+    rest = steps[names.index("Basic") + 1:]
+    if not rest:
+        return "", "contentid"
+
+    name, position = rest[0]
+    child = rest[1] if len(rest) > 1 else None
+    if name == "LocalizedInfo":
+        if position > len(title.localized):
+            return "", ""
+        loc = title.localized[position - 1]
+        if child is None:
+            return loc.language, "language"
+        if child[0] == "ArtReference" and child[1] <= len(loc.art):
+            return loc.language, loc.art[child[1] - 1].purpose
+        if child[0] == "Genre":
+            return loc.language, f"genre{child[1]}"
+        return loc.language, LOCALIZED_COLUMNS.get(child[0], "")
+    if name == "People":
+        if position > len(title.people):
+            return "", ""
+        person = title.people[position - 1]
+        column = f"{person.job_function.lower()}{person.billing_order}"
+        display = rest[2] if len(rest) > 2 and rest[2][0] == "DisplayName" else None
+        if display and display[1] <= len(person.names):
+            return person.names[display[1] - 1][0], column
+        return "", column
+    return "", BASIC_COLUMNS.get(name, "")
+
+
+# title(Title 또는 행 목록)을 넘기면 오류 위치를 CSV 행/컬럼으로 채웁니다.
+def validate_xml(xml, title=None, schema_dir=None):
+    etree = _import_lxml()
+    schema = get_schema(schema_dir)
+    if title is not None and not isinstance(title, Title):
+        title = build_title(title)
+    try:
+        doc = etree.fromstring(xml, etree.XMLParser(no_network=True, resolve_entities=False))
+    except etree.XMLSyntaxError as e:
+        return [dict(zip(SCHEMA_COLUMNS, (title.content_id if title else "", "", "", e.lineno, "", str(e))))]
+
+    # lxml 스키마 객체의 error_log는 인스턴스에 하나뿐이라 검증과 로그 읽기를 묶어서 잠급니다.
+    with _lock:
+        schema.validate(doc)
+        log = [(e.line, e.path, e.message) for e in schema.error_log]
+
+    errors = []
+    for line, path, message in log:
+        language, column = locate(title, path) if title is not None else ("", "")
+        errors.append(dict(zip(SCHEMA_COLUMNS, (title.content_id if title else "", language, column, line, path, _short_message(message)))))
+    return errors
+
+
+def format_errors(errors, limit=5):
+    parts = []
+    for e in errors[:limit]:
+        where = e["column"] or f"line {e['line']}"
+        if e["language"]:
+            where = f"[{e['language']}] {where}"
+        parts.append(f"{where}: {e['message']}")
+    more = f" 외 {len(errors) - limit}건" if len(errors) > limit else ""
+    return f"XSD 오류 {len(errors)}건: " + "; ".join(parts) + more
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MEC v2.6 XSD 관리")
+    parser.add_argument("--fetch", action="store_true", help="MovieLabs에서 XSD를 받아 스키마 폴더에 저장")
+    parser.add_argument("--url", default=SCHEMA_URL, help=f"{MAIN_SCHEMA} 주소 (기본값: %(default)s)")
+    parser.add_argument("--dir", default=None, help="스키마 폴더 (기본값: MEC_SCHEMA_DIR 또는 schemas/)")
+    args = parser.parse_args(argv)
+
+    if args.fetch:
+        try:
+            saved = fetch_schemas(args.dir, args.url)
+        except (OSError, ET.ParseError) as e:
+            print(f"XSD를 받지 못했습니다: {e}", file=sys.stderr)
+            return 1
+        print(f"{len(saved)} files -> {os.path.abspath(args.dir or SCHEMA_DIR)}: {', '.join(saved)}")
+    error = schema_error(args.dir)
+    print(error or "MEC XSD 컴파일 확인")
+    return 1 if error else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# Streamlit 없이 MEC XML을 생성하는 HTTP 서비스.
+#
+#   POST /generate   CSV(text/csv) 또는 JSON(행 객체 배열 / {"rows": [...]}) → MEC XML
+#                    검증 실패 시 422 + JSON 오류 리포트 (--schema면 MEC XSD 검증 오류 포함)
+#   POST /batch      여러 타이틀 → <contentid>.xml + report.csv ZIP (chunked 스트리밍)
+#   GET  /healthz    상태 확인
+#   GET  /metrics    Prometheus 형식 단계별 지표
+#
+# 사용법: python mec_service.py --port 8080 --workers 4 --max-concurrent 8 [--schema]
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import mec_metrics
+from mec_metrics import stage
+from batch_mec import ZipSink, generate_stream, split_titles
+from generate_mec import generate_mec_xml
+from mec_ingest import read_csv_records
+from mec_schema import get_schema, validate_xml
+
+MAX_BODY_BYTES = 64 * 1024 ** 2
+
+logger = logging.getLogger("mec.service")
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class _ChunkedWriter:
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, data):
+        if data:
+            self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + bytes(data) + b"\r\n")
+        return len(data)
+
+    def flush(self):
+        self.wfile.flush()
+
+    def close(self):
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def parse_body(content_type, body):
+    content_type = (content_type or "").split(";")[0].strip().lower()
+    try:
+        if content_type == "application/json":
+            payload = json.loads(body)
+            rows = payload.get("rows") if isinstance(payload, dict) else payload
+            if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+                raise RequestError(400, "JSON 본문은 행 객체 배열 또는 {\"rows\": [...]} 형식이어야 합니다.")
+            records = [{str(k).lower(): v for k, v in row.items()} for row in rows]
+        elif content_type in ("text/csv", "application/csv", ""):
+            records = read_csv_records(io.BytesIO(body))
+        else:
+            raise RequestError(415, f"지원하지 않는 Content-Type: {content_type}")
+    except (ValueError, csv.Error) as e:
+        raise RequestError(400, f"본문을 읽을 수 없습니다: {e}")
+    if not records:
+        raise RequestError(400, "본문에 데이터 행이 없습니다.")
+    return records
+
+
+# 검증 엔진은 pandas 기반이라 import에 시간이 걸리므로, 서버는 먼저 요청을 받기 시작하고
+# 백그라운드에서 미리 불러옵니다.
+def _load_validator():
+    from mec_validation import split_levels, validate_dataframe
+
+    return validate_dataframe, split_levels
+
+
+# (오류, 경고) 레코드 목록
+def validate_records(records):
+    import pandas as pd
+
+    validate_dataframe, split_levels = _load_validator()
+    errors, warnings = split_levels(validate_dataframe(pd.DataFrame(records)))
+    return errors.to_dict("records"), warnings.to_dict("records")
+
+
+# 워커에서 실행: 생성 후 schema=True면 XSD 검증 오류를 (CSV 언어/컬럼 위치와 함께) 돌려줍니다.
+def _generate_xml(records, schema=False):
+    result = generate_mec_xml(records)
+    if schema and result.valid:
+        return result, validate_xml(result.xml, records)
+    return result, []
+
+
+class MecRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "mec-generator"
+
+    def do_GET(self):
+        if self.path == "/healthz":
+            self._send(200, "text/plain; charset=utf-8", b"ok\n")
+        elif self.path == "/metrics":
+            self._send(200, "text/plain; version=0.0.4", mec_metrics.prometheus_text().encode("utf-8"))
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        handlers = {"/generate": self._generate, "/batch": self._batch}
+        handler = handlers.get(self.path.split("?")[0])
+        if handler is None:
+            self._send_json(404, {"error": "not found"})
+            return
+        if not self.server.slots.acquire(blocking=False):
+            self.close_connection = True
+            self._send_json(503, {"error": "동시 요청 한도를 초과했습니다."}, {"Retry-After": "1"})
+            return
+        self.streaming = False
+        try:
+            handler(parse_body(self.headers.get("Content-Type"), self._read_body()))
+        except RequestError as e:
+            self._send_error(e.status, str(e))
+        except UnicodeError as e:
+            # 짝이 없는 서로게이트("\ud800") 등 UTF-8로 인코딩할 수 없는 값
+            self._send_error(400, f"본문에 처리할 수 없는 문자가 있습니다: {e}")
+        except Exception:
+            logger.exception("%s 처리 중 오류", self.path)
+            self._send_error(500, "내부 오류가 발생했습니다.")
+        finally:
+            self.server.slots.release()
+
+    # ZIP 스트리밍이 시작된 뒤에는 상태 코드를 바꿀 수 없으므로 연결을 끊어 불완전한 응답임을 알립니다.
+    def _send_error(self, status, message):
+        if self.streaming:
+            self.close_connection = True
+            return
+        self._send_json(status, {"error": message})
+
+    def _read_body(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            raise RequestError(400, "Content-Length가 올바르지 않습니다.")
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise RequestError(413, f"본문이 너무 큽니다 (최대 {MAX_BODY_BYTES} bytes).")
+        return self.rfile.read(length)
+
+    # 오류가 있으면 422 리포트를 보내고 None, 없으면 경고 목록을 돌려줍니다.
+    def _validate(self, records):
+        errors, warnings = validate_records(records)
+        if errors:
+            self._send_json(422, {"error": "validation failed", "errors": errors, "warnings": warnings})
+            return None
+        return warnings
+
+    def _generate(self, records):
+        warnings = self._validate(records)
+        if warnings is None:
+            return
+        # normalize/build_tree/serialize 단계는 워커 프로세스에서 기록되므로 요청 단위 시간은 여기서 잽니다.
+        with stage("generate"):
+            result, schema_errors = self.server.executor.submit(_generate_xml, records, self.server.schema).result()
+        if schema_errors:
+            self._send_json(422, {"error": "schema validation failed", "errors": schema_errors})
+            return
+        if not result.valid:
+            self._send_json(422, {
+                "error": "invalid xml",
+                "message": result.error,
+                "line": result.line,
+                "column": result.column,
+            })
+            return
+        # 경고(해석하지 못해 원래 값 그대로 쓴 releasedate/ratinginfo)는 헤더로 함께 보냅니다.
+        headers = {"X-MEC-Warnings": json.dumps(warnings, default=str)} if warnings else None
+        self._send(200, "application/xml; charset=utf-8", result.xml, headers)
+
+    def _batch(self, records):
+        if "contentid" not in records[0]:
+            raise RequestError(400, "'contentid' 컬럼이 없습니다.")
+        # 경고는 report.csv의 warnings 컬럼에 기록됩니다.
+        if self._validate(records) is None:
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Disposition", 'attachment; filename="MEC_Metadata_batch.zip"')
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self.streaming = True
+        writer = _ChunkedWriter(self.wfile)
+        with stage("batch"):
+            generate_stream(split_titles(records), ZipSink(writer), max_workers=self.server.workers,
+                            executor=self.server.executor, schema=self.server.schema)
+        writer.close()
+
+    def _send(self, status, content_type, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self._send(status, "application/json; charset=utf-8", body, headers)
+
+
+class MecServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, workers=None, max_concurrent=8, schema=False):
+        super().__init__(address, MecRequestHandler)
+        self.workers = workers or os.cpu_count() or 1
+        self.schema = schema
+        # 프로세스는 첫 요청 때 만들어지므로 서버 시작 시간에는 영향이 없습니다.
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        threading.Thread(target=_load_validator, name="validator-preload", daemon=True).start()
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MEC XML 생성 HTTP 서비스")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-j", "--workers", type=int, default=None, help="생성 워커 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--max-concurrent", type=int, default=8, help="동시에 처리할 최대 요청 수 (초과 시 503)")
+    parser.add_argument("--schema", action="store_true",
+                        help="생성된 XML을 MEC XSD로 검증 (lxml 필요, XSD 위치: MEC_SCHEMA_DIR 또는 schemas/)")
+    args = parser.parse_args(argv)
+    if args.schema:
+        try:
+            get_schema()
+        except (ImportError, OSError, ValueError) as e:
+            parser.error(str(e))
+
+    server = MecServer((args.host, args.port), workers=args.workers, max_concurrent=args.max_concurrent,
+                       schema=args.schema)
+    print(f"MEC service listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+# Streamlit 세션 자원 관리. 업로드 파일은 세션 임시 폴더에 스풀하고, 메모리에는 작은 결과만 둡니다.
+#
+# - 결과는 (업로드 내용 해시, 생성기 버전 ...) 키로 프로세스 전체가 공유합니다. 같은 파일을 올린 세션들은
+#   한 번 계산한 결과를 함께 참조하고, 결과 크기는 예산에 한 번만 계산됩니다.
+# - 결과 합계가 budget_bytes를 넘으면 가장 오래 사용하지 않은 결과부터 비웁니다. 어떤 세션도 참조하지 않는
+#   결과가 먼저이고, 호출한 세션이 참조하는 결과와 렌더링 중인(pinned) 결과는 남깁니다.
+#   (비워진 결과는 스풀 파일에서 다시 계산합니다)
+# - idle_seconds 동안 요청이 없는 세션은 스풀 파일까지 삭제하고 참조를 놓습니다.
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+DEFAULT_BUDGET_BYTES = 512 * 1024 ** 2
+DEFAULT_IDLE_SECONDS = 30 * 60
+CHUNK_SIZE = 1024 ** 2
+
+
+@dataclass(frozen=True)
+class SpooledUpload:
+    filename: str
+    path: str
+    digest: str
+    size: int
+
+
+@dataclass
+class _Session:
+    path: str
+    last_seen: float
+    uploads: dict = field(default_factory=dict)
+    # slot → 참조 중인 결과 키
+    results: dict = field(default_factory=dict)
+
+
+@dataclass
+class _Result:
+    value: object
+    size: int
+    path: str
+    sessions: set = field(default_factory=set)
+
+
+# 결과 크기를 대략 계산합니다. (DataFrame은 memory_usage, 나머지는 컨테이너/속성을 따라가며 합산)
+def sizeof(value, seen=None):
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if hasattr(value, "memory_usage") and not isinstance(value, type):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        return size + sum(sizeof(k, seen) + sizeof(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(sizeof(v, seen) for v in value)
+    if hasattr(value, "__dict__"):
+        return size + sizeof(vars(value), seen)
+    return size
+
+
+class SessionStore:
+    def __init__(self, root=None, budget_bytes=DEFAULT_BUDGET_BYTES, idle_seconds=DEFAULT_IDLE_SECONDS):
+        self.root = tempfile.mkdtemp(prefix="mec-sessions-", dir=root)
+        self.budget_bytes = budget_bytes
+        self.idle_seconds = idle_seconds
+        self.evictions = 0
+        self._sessions = OrderedDict()
+        self._results = OrderedDict()
+        self._computing = {}
+        self._pins = {}
+        self._lock = threading.RLock()
+
+    # 호출한 세션의 마지막 사용 시각을 갱신하고 예산/유휴 기준으로 정리합니다.
+    def touch(self, session_id):
+        with self._lock:
+            self._session(session_id)
+            self.evict(keep=session_id)
+
+    def _session(self, session_id):
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = _Session(tempfile.mkdtemp(dir=self.root), time.monotonic())
+            self._sessions[session_id] = session
+        session.last_seen = time.monotonic()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    # 업로드 파일(file-like)을 청크 단위로 디스크에 쓰면서 해시를 계산합니다.
+    # 같은 slot의 이전 파일은 지우고 이전 결과 참조를 놓습니다.
+    def spool(self, session_id, slot, uploaded_file, filename=None):
+        filename = filename or getattr(uploaded_file, "name", slot)
+        with self._lock:
+            session = self._session(session_id)
+            self._clear_slot(session_id, session, slot)
+            target = os.path.join(session.path, f"{slot}{os.path.splitext(filename)[1].lower()}")
+
+        digest = hashlib.sha256()
+        size = 0
+        uploaded_file.seek(0)
+        with open(target, "wb") as f:
+            for chunk in iter(lambda: uploaded_file.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+
+        upload = SpooledUpload(filename, target, digest.hexdigest(), size)
+        with self._lock:
+            self._session(session_id).uploads[slot] = upload
+        return upload
+
+    def upload(self, session_id, slot):
+        with self._lock:
+            session = self._sessions.get(session_id)
+            upload = session.uploads.get(slot) if session else None
+            return upload if upload and os.path.exists(upload.path) else None
+
+    def clear(self, session_id, slot):
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session:
+                self._clear_slot(session_id, session, slot)
+
+    def _clear_slot(self, session_id, session, slot):
+        upload = session.uploads.pop(slot, None)
+        if upload and os.path.exists(upload.path):
+            os.remove(upload.path)
+        self._release(session_id, session.results.pop(slot, None))
+
+    def _release(self, session_id, key):
+        result = self._results.get(key)
+        if result is not None:
+            result.sessions.discard(session_id)
+
+    # 결과와 함께 보관할 파일(예: 일괄 생성 ZIP)의 경로. 결과 키마다 하나의 폴더를 쓰고 결과가 비워질 때 함께 지웁니다.
+    def result_path(self, key, name):
+        folder = os.path.join(self.root, "results", hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:24])
+        os.makedirs(folder, exist_ok=True)
+        return os.path.join(folder, name)
+
+    def get(self, session_id, slot, key):
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                return None
+            self._results.move_to_end(key)
+            self._reference(session_id, slot, key, result)
+            return result.value
+
+    def _reference(self, session_id, slot, key, result):
+        session = self._session(session_id)
+        previous = session.results.get(slot)
+        if previous != key:
+            self._release(session_id, previous)
+            session.results[slot] = key
+        result.sessions.add(session_id)
+
+    def put(self, session_id, slot, key, value, size=None):
+        with self._lock:
+            result = _Result(value, sizeof(value) if size is None else size, os.path.dirname(self.result_path(key, "")))
+            self._results[key] = result
+            self._reference(session_id, slot, key, result)
+            self.evict(keep=session_id)
+        return value
+
+    # 결과가 없으면(처음이거나 예산 때문에 비워졌으면) compute()로 다시 만듭니다.
+    # 같은 키를 여러 세션이 동시에 요청하면 한 세션만 계산하고 나머지는 그 결과를 씁니다.
+    def cached(self, session_id, slot, key, compute):
+        value = self.get(session_id, slot, key)
+        if value is not None:
+            return value
+        with self._lock:
+            lock = self._computing.setdefault(key, threading.Lock())
+        try:
+            with lock:
+                value = self.get(session_id, slot, key)
+                if value is None:
+                    value = self.put(session_id, slot, key, compute())
+        finally:
+            with self._lock:
+                self._computing.pop(key, None)
+        return value
+
+    # 고정된 결과는 예산을 넘어도 비우지 않습니다. (결과가 아직 없어도 키를 먼저 고정할 수 있습니다)
+    @contextmanager
+    def pinned(self, key):
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pins[key] -= 1
+                if not self._pins[key]:
+                    del self._pins[key]
+
+    def memory_bytes(self):
+        with self._lock:
+            return sum(result.size for result in self._results.values())
+
+    def _drop(self, key):
+        result = self._results.pop(key)
+        shutil.rmtree(result.path, ignore_errors=True)
+        for session in self._sessions.values():
+            for slot, ref in list(session.results.items()):
+                if ref == key:
+                    del session.results[slot]
+
+    def evict(self, keep=None, now=None):
+        now = time.monotonic() if now is None else now
+        evicted = 0
+        with self._lock:
+            for session_id, session in list(self._sessions.items()):
+                if session_id != keep and now - session.last_seen > self.idle_seconds:
+                    for key in session.results.values():
+                        self._release(session_id, key)
+                    shutil.rmtree(session.path, ignore_errors=True)
+                    del self._sessions[session_id]
+
+            # OrderedDict 앞쪽이 가장 오래 사용하지 않은 결과입니다. 참조가 없는 결과부터 비웁니다.
+            total = self.memory_bytes()
+            for referenced in (False, True):
+                for key, result in list(self._results.items()):
+                    if total <= self.budget_bytes:
+                        break
+                    if bool(result.sessions) != referenced or keep in result.sessions or key in self._pins:
+                        continue
+                    total -= result.size
+                    self._drop(key)
+                    evicted += 1
+            self.evictions += evicted
+        return evicted
+
+    def stats(self):
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "results": len(self._results),
+                "memory_bytes": self.memory_bytes(),
+                "spool_bytes": sum(u.size for s in self._sessions.values() for u in s.uploads.values()),
+                "evictions": self.evictions,
+            }
+
+    def close(self):
+        with self._lock:
+            self._sessions.clear()
+            self._results.clear()
+            shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,124 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+NAMESPACES = {
+    "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+    "md": "http://www.movielabs.com/schema/md/v2.6/md",
+    "mdmec": "http://www.movielabs.com/schema/mdmec/v2.6",
+}
+_PREFIXES = {f"{{{uri}}}": f"{prefix}:" for prefix, uri in NAMESPACES.items()}
+
+SAMPLE_FILES = {
+    "Movie": "Movie.xml",
+    "Series": "Series.xml",
+    "Season": "Season.xml",
+    "Episode": "Episode.xml",
+}
+
+
+def qualified_name(name):
+    if name.startswith("{"):
+        uri, _, local = name.partition("}")
+        return _PREFIXES.get(uri + "}", uri + "}") + local
+    return name
+
+
+@dataclass
+class PathIndex:
+    counts: dict = field(default_factory=dict)
+    max_per_parent: dict = field(default_factory=dict)
+    attributes: dict = field(default_factory=dict)
+    work_type: str = ""
+
+    def add(self, path, elem):
+        self.counts[path] = self.counts.get(path, 0) + 1
+        names = {qualified_name(k) for k in elem.attrib if not k.startswith("xmlns")}
+        if path in self.attributes:
+            self.attributes[path] &= names
+        else:
+            self.attributes[path] = names
+        if path.endswith("/md:WorkType") and elem.text:
+            self.work_type = elem.text.strip().lower()
+
+    def add_siblings(self, child_counts):
+        for path, n in child_counts.items():
+            if n > self.max_per_parent.get(path, 0):
+                self.max_per_parent[path] = n
+
+
+def _index_element(elem, index, path):
+    current = f"{path}/{qualified_name(elem.tag)}"
+    index.add(current, elem)
+    child_counts = {}
+    for child in elem:
+        child_path = _index_element(child, index, current)
+        child_counts[child_path] = child_counts.get(child_path, 0) + 1
+    index.add_siblings(child_counts)
+    return current
+
+
+def index_tree(root):
+    index = PathIndex()
+    _index_element(root, index, "")
+    return index
+
+
+def load_sample_indexes(sample_files=None):
+    indexes = {}
+    for name, filename in (sample_files or SAMPLE_FILES).items():
+        try:
+            indexes[name] = index_tree(ET.parse(filename).getroot())
+        except (FileNotFoundError, ET.ParseError):
+            continue
+    return indexes
+
+
+@dataclass
+class StructureDiff:
+    missing: list
+    extra: list
+    repeated: list
+    missing_attributes: list
+
+    @property
+    def issue_count(self):
+        return len(self.missing) + len(self.extra) + len(self.repeated) + len(self.missing_attributes)
+
+
+def diff_structure(sample, generated):
+    missing = sorted(p for p in sample.counts if p not in generated.counts)
+    extra = sorted(p for p in generated.counts if p not in sample.counts)
+    # 샘플에서 부모당 한 번만 나오는 태그가 생성 XML에서 반복되는 경우
+    repeated = sorted(
+        (p, generated.max_per_parent[p])
+        for p in generated.max_per_parent
+        if sample.max_per_parent.get(p) == 1 and generated.max_per_parent[p] > 1
+    )
+    missing_attributes = sorted(
+        (p, sorted(sample.attributes[p] - generated.attributes[p]))
+        for p in sample.attributes
+        if p in generated.attributes and sample.attributes[p] - generated.attributes[p]
+    )
+    return StructureDiff(missing, extra, repeated, missing_attributes)
+
+
+def diff_all(samples, generated):
+    return {name: diff_structure(sample, generated) for name, sample in samples.items()}
+
+
+def best_match(samples, generated, diffs=None):
+    for name, sample in samples.items():
+        if generated.work_type and sample.work_type == generated.work_type:
+            return name
+    diffs = diffs or diff_all(samples, generated)
+    return min(diffs, key=lambda name: diffs[name].issue_count) if diffs else None
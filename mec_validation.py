@@ -0,0 +1,123 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+import pandas as pd
+
+from generate_mec import parse_date, parse_ratings
+from mec_metrics import stage
+
+ERROR_COLUMNS = ["row", "language", "level", "rule", "column", "value", "message"]
+REQUIRED_MOVIE_ART = ["boxart", "cover", "poster"]
+
+RULES = {}
+# 규칙 이름 → "error"(생성 중단) 또는 "warning"(값을 그대로 쓰고 알림만)
+LEVELS = {}
+
+
+def rule(name, level="error"):
+    def register(func):
+        RULES[name] = func
+        LEVELS[name] = level
+        return func
+    return register
+
+
+# 규칙들이 같은 컬럼을 여러 번 문자열로 변환하지 않도록 변환 결과를 공유합니다.
+class _Frame:
+    def __init__(self, df):
+        self.df = df
+        self.rows = pd.RangeIndex(2, len(df) + 2)
+        self._text = {}
+
+    def text(self, column):
+        if column not in self._text:
+            if column in self.df.columns:
+                s = self.df[column]
+                self._text[column] = s.where(s.notna(), "").astype(str).reset_index(drop=True)
+            else:
+                self._text[column] = pd.Series("", index=pd.RangeIndex(len(self.df)), dtype=object)
+        return self._text[column]
+
+    def mapped(self, column, func):
+        # worktype, 아트 파일명처럼 반복 값이 많은 컬럼은 고유값에만 func를 적용합니다.
+        codes, uniques = pd.factorize(self.text(column))
+        return pd.Series(uniques.map(func).to_numpy()[codes])
+
+    def errors(self, mask, rule_name, column, message, value=None):
+        mask = mask.to_numpy()
+        if not mask.any():
+            return None
+        return pd.DataFrame({
+            "row": self.rows[mask],
+            "language": self.text("language").to_numpy()[mask],
+            "level": LEVELS.get(rule_name, "error"),
+            "rule": rule_name,
+            "column": column,
+            "value": value.to_numpy()[mask] if value is not None else "",
+            "message": message,
+        })
+
+
+def _max_length_rule(column, limit):
+    def check(frame):
+        lengths = frame.text(column).str.len()
+        mask = lengths > limit
+        return frame.errors(mask, f"{column}_length", column, f"글자 수 {limit}자 초과", lengths)
+    return check
+
+
+rule("summary190_length")(_max_length_rule("summary190", 190))
+rule("summary400_length")(_max_length_rule("summary400", 400))
+
+
+@rule("movie_art_required")
+def check_movie_art(frame):
+    is_movie = frame.mapped("worktype", lambda v: v.strip().lower() == "movie")
+    found = []
+    for column in REQUIRED_MOVIE_ART:
+        missing = frame.mapped(column, lambda v: not v.strip())
+        found.append(frame.errors(is_movie & missing, "movie_art_required", column, "ArtReference 필수 항목 누락 (worktype=movie)"))
+    found = [f for f in found if f is not None]
+    return pd.concat(found, ignore_index=True) if found else None
+
+
+# 날짜/등급 문자열은 고유값에만 캐시된 파서를 적용합니다.
+# 해석하지 못한 값도 원래 값 그대로 XML에 들어가므로 경고로만 알립니다. (일괄 생성 리포트의 warnings와 같은 기준)
+@rule("releasedate_format", level="warning")
+def check_release_date(frame):
+    invalid = frame.mapped("releasedate", lambda v: not parse_date(v)[1])
+    return frame.errors(invalid, "releasedate_format", "releasedate", "날짜 형식 오류 (YYYY-MM-DD 또는 YYYY.MM.DD)",
+                        frame.text("releasedate"))
+
+
+@rule("ratinginfo_format", level="warning")
+def check_rating_info(frame):
+    invalid = frame.mapped("ratinginfo", lambda v: ";".join(parse_ratings(v)[1]))
+    return frame.errors(invalid != "", "ratinginfo_format", "ratinginfo", "등급 형식 오류 (국가:등급체계:등급;...)", invalid)
+
+
+def validate_dataframe(df: pd.DataFrame, rules=None):
+    df.columns = df.columns.str.lower()
+    frame = _Frame(df)
+    found = []
+    with stage("validate"):
+        for name in rules or RULES:
+            errors = RULES[name](frame)
+            if errors is not None:
+                found.append(errors)
+    if not found:
+        return pd.DataFrame(columns=ERROR_COLUMNS)
+    return pd.concat(found, ignore_index=True).sort_values(["row", "rule"], kind="stable").reset_index(drop=True)
+
+
+# (생성을 막는 오류, 경고)로 나눕니다.
+def split_levels(errors):
+    is_error = errors["level"] == "error"
+    return errors[is_error].reset_index(drop=True), errors[~is_error].reset_index(drop=True)
@@ -0,0 +1,106 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import tempfile
+
+from generate_mec import GENERATOR_VERSION
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+
+# 정규화된 Title 모델을 해시합니다. 빈 값은 모델에 들어가지 않으므로
+# 빈 컬럼이 추가/삭제된 재납품 파일도 같은 키를 갖습니다.
+def title_key(title, generator_version=GENERATOR_VERSION):
+    payload = {"version": generator_version, "title": title}
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+# 디스크 기반 MEC XML 캐시. 파일 mtime을 마지막 사용 시각으로 삼아
+# 전체 크기가 max_bytes를 넘으면 오래 사용하지 않은 파일부터 지웁니다.
+class OutputCache:
+    def __init__(self, root, max_bytes=DEFAULT_MAX_BYTES):
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = sum(os.path.getsize(p) for p, _ in self._entries())
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.xml")
+
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith(".xml"):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        yield path, os.stat(path).st_mtime
+                    except FileNotFoundError:
+                        continue
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                xml = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return xml
+
+    def put(self, key, xml):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(xml)
+        # 같은 키를 다시 쓰면 이전 파일 크기를 빼고 새 크기만 더합니다.
+        try:
+            previous = os.path.getsize(path)
+        except FileNotFoundError:
+            previous = 0
+        os.replace(tmp_path, path)
+        self._size += len(xml) - previous
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self, target_ratio=0.9):
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self._size = sum(os.path.getsize(p) for p, _ in entries)
+        for path, _ in entries:
+            if self._size <= self.max_bytes * target_ratio:
+                break
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            self._size -= size
+            self.evictions += 1
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,119 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+import logging
+import queue
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+MAX_DIGEST_ITEMS = 30
+MAX_ITEM_CHARS = 1500
+_STOP = object()
+
+
+def format_digest(items):
+    if len(items) == 1:
+        filename, message = items[0]
+        return f"*MEC XML 유효성 검사 실패!*\n📄 파일명: `{filename}`\n```{message[:MAX_ITEM_CHARS]}```"
+
+    lines = [f"*MEC XML 유효성 검사 실패 {len(items)}건*"]
+    for filename, message in items[:MAX_DIGEST_ITEMS]:
+        lines.append(f"📄 `{filename}`\n```{message[:MAX_ITEM_CHARS]}```")
+    if len(items) > MAX_DIGEST_ITEMS:
+        lines.append(f"... 외 {len(items) - MAX_DIGEST_ITEMS}건")
+    return "\n".join(lines)
+
+
+# 백그라운드 스레드 하나가 큐에 쌓인 알림을 window초 단위로 모아 한 번에 보냅니다.
+# notify()는 큐에 넣기만 하므로 Slack이 느리거나 응답이 없어도 호출한 쪽은 기다리지 않습니다.
+class SlackNotifier:
+    def __init__(self, webhook_url, window=10.0, max_queue=1000, timeout=(3.05, 10),
+                 max_retries=4, backoff=0.5, session=None):
+        self.webhook_url = webhook_url
+        self.window = window
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.session = session or self._make_session()
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="slack-notifier", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _make_session():
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        return session
+
+    def notify(self, message, filename="(알 수 없음)"):
+        try:
+            self._queue.put_nowait((filename, message))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def close(self, timeout=None):
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self.session.close()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            items = [item]
+            deadline = time.monotonic() + self.window
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                items.append(item)
+            self._send(format_digest(items))
+
+    def _send(self, text):
+        for attempt in range(self.max_retries + 1):
+            delay = self.backoff * (2 ** attempt)
+            try:
+                response = self.session.post(self.webhook_url, json={"text": text}, timeout=self.timeout)
+                if response.status_code == 200:
+                    self.sent += 1
+                    return True
+                if response.status_code == 429:
+                    delay = max(delay, float(response.headers.get("Retry-After", 0) or 0))
+                elif response.status_code < 500:
+                    logger.warning("Slack 전송 실패: %s / %s", response.status_code, response.reason)
+                    break
+                logger.warning("Slack 전송 실패 (%d회차): %s", attempt + 1, response.status_code)
+            except requests.RequestException as e:
+                logger.warning("Slack 전송 중 예외 발생 (%d회차): %s", attempt + 1, e)
+            if attempt < self.max_retries:
+                time.sleep(delay)
+        self.failed += 1
+        return False
@@ -0,0 +1,34 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+import pytest
+
+from generate_mec import generate_mec_xml
+
+
+def _rows(title):
+    return [{"contentid": "1", "language": "en-US", "title": title, "worktype": "Movie"}]
+
+
+@pytest.mark.parametrize("title, marker", [("a\x01b", "\x01"), ("a\ud800b", "&#55296;")])
+def test_invalid_character_reports_position(title, marker):
+    result = generate_mec_xml(_rows(title))
+
+    assert not result.valid
+    assert "<md:TitleDisplayUnlimited>" in result.error
+    line = result.text.splitlines()[result.line - 1]
+    assert line[result.column:].startswith(marker)
+
+
+def test_valid_title_serializes():
+    result = generate_mec_xml(_rows("Title"))
+
+    assert result.valid
+    assert result.line is None
@@ -0,0 +1,31 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2024 EncodingHouse Team. All Rights Reserved.
+#
+# 본 소스코드는 EncodingHouse Team의 독점 자산입니다.
+# 사전 서면 허가 없이 복제, 수정, 배포, 공개 또는 상업적 이용을 엄격히 금지합니다.
+#
+# Unauthorized copying, modification, distribution, publication, or commercial use
+# of this file is strictly prohibited without prior written consent from EncodingHouse Team.
+# ------------------------------------------------------------------------------
+
+import os
+
+import pytest
+
+from generate_mec import build_title, generate_mec_xml
+from mec_reader import read_mec
+from mec_schema import schema_error, validate_xml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# MovieLabs XSD(python mec_schema.py --fetch)와 lxml이 있을 때만 실행합니다.
+pytestmark = pytest.mark.skipif(bool(schema_error()), reason=schema_error() or "MEC XSD 사용 가능")
+
+
+@pytest.mark.parametrize("sample", ["Movie.xml", "Episode.xml"])
+def test_generated_sample_validates_against_mec_xsd(sample):
+    title = build_title(read_mec(os.path.join(ROOT, sample)))
+    result = generate_mec_xml(title)
+
+    assert result.valid
+    assert validate_xml(result.xml, title) == []